@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the Bareiss and LU determinant paths of `0-determinant`
+against the original first-row cofactor expansion.
+"""
+import random
+import time
+
+determinant = __import__('0-determinant').determinant
+
+
+def cofactor_determinant(matrix):
+    """Recursive first-row cofactor expansion, O(n!)."""
+    n = len(matrix)
+    if n == 1:
+        return matrix[0][0]
+    if n == 2:
+        return matrix[0][0]*matrix[1][1] - matrix[0][1]*matrix[1][0]
+    det = 0
+    for col in range(n):
+        minor = [row[:col] + row[col+1:] for row in matrix[1:]]
+        det += ((-1) ** col) * matrix[0][col] * cofactor_determinant(minor)
+    return det
+
+
+def timed(func, *args, **kwargs):
+    """Returns the wall time in seconds of a single call."""
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    print("{:>5} {:>12} {:>12} {:>12}".format(
+        "n", "cofactor", "bareiss", "lu"))
+    for n in (5, 8, 10, 20, 50, 100, 200):
+        mat = [[random.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+        cof = timed(cofactor_determinant, mat) if n <= 8 else None
+        bar = timed(determinant, mat, method='bareiss')
+        lu = timed(determinant, mat, method='lu')
+        print("{:>5} {:>12} {:>12.6f} {:>12.6f}".format(
+            n, "-" if cof is None else "{:.6f}".format(cof), bar, lu))
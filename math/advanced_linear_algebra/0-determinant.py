@@ -2,20 +2,135 @@
 """
 This module contains a function `determinant` to calculate the determinant
 of a square matrix represented as a list of lists.
+
+Two O(n^3) elimination schemes are available:
+    - `bareiss_determinant`: fraction-free Bareiss elimination, exact for
+      integer and `fractions.Fraction` entries.
+    - `lu_determinant`: LU decomposition with partial pivoting in floating
+      point, used for any other numeric entries.
 """
+from fractions import Fraction
+
+
+def is_exact(matrix):
+    """
+    Checks whether every entry of a matrix is an exact rational number.
+
+    Args:
+        matrix (list of lists): The matrix to inspect.
+
+    Returns:
+        bool: True if all entries are int or Fraction (bool excluded).
+    """
+    return all(
+        isinstance(x, (int, Fraction)) and not isinstance(x, bool)
+        for row in matrix for x in row
+    )
+
+
+def bareiss_determinant(matrix):
+    """
+    Calculates the determinant with fraction-free Bareiss elimination.
+
+    Every intermediate division is exact, so integer input yields the
+    exact integer determinant and Fraction input an exact Fraction.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix of int or
+        Fraction entries.
+
+    Returns:
+        int or Fraction: The determinant of the matrix.
+    """
+    n = len(matrix)
+    ints = all(isinstance(x, int) for row in matrix for x in row)
+    mat = [list(row) if ints else [Fraction(x) for x in row]
+           for row in matrix]
+    sign = 1
+    prev = 1
 
+    for k in range(n - 1):
+        # Swap a non-zero pivot into place, the determinant flips sign
+        if mat[k][k] == 0:
+            for i in range(k + 1, n):
+                if mat[i][k] != 0:
+                    mat[k], mat[i] = mat[i], mat[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+        pivot_row = mat[k]
+        pivot = pivot_row[k]
+        for i in range(k + 1, n):
+            row = mat[i]
+            factor = row[k]
+            if ints:
+                for j in range(k + 1, n):
+                    row[j] = (pivot * row[j] - factor * pivot_row[j]) // prev
+            else:
+                for j in range(k + 1, n):
+                    row[j] = (pivot * row[j] - factor * pivot_row[j]) / prev
+        prev = pivot
 
-def determinant(matrix):
+    det = sign * mat[n - 1][n - 1]
+    if isinstance(det, Fraction) and det.denominator == 1:
+        return det.numerator
+    return det
+
+
+def lu_determinant(matrix):
+    """
+    Calculates the determinant with LU decomposition and partial pivoting.
+
+    The matrix is reduced in place (on a float copy) to its upper
+    triangular factor U, and the determinant is the signed product of the
+    diagonal of U.
+
+    Args:
+        matrix (list of lists): A non-empty square numeric matrix.
+
+    Returns:
+        float: The determinant of the matrix.
+    """
+    n = len(matrix)
+    mat = [[float(x) for x in row] for row in matrix]
+    det = 1.0
+
+    for k in range(n):
+        # Partial pivoting: largest magnitude entry in column k
+        p = max(range(k, n), key=lambda r: abs(mat[r][k]))
+        if mat[p][k] == 0:
+            return 0.0
+        if p != k:
+            mat[k], mat[p] = mat[p], mat[k]
+            det = -det
+        pivot_row = mat[k]
+        pivot = pivot_row[k]
+        det *= pivot
+        for i in range(k + 1, n):
+            row = mat[i]
+            factor = row[k] / pivot
+            if factor:
+                for j in range(k + 1, n):
+                    row[j] -= factor * pivot_row[j]
+
+    return det
+
+
+def determinant(matrix, method=None):
     """
     Calculates the determinant of a square matrix.
 
     Args:
         matrix (list of lists): The square matrix to calculate the
         determinant of.
+        method (str): 'bareiss' for exact elimination or 'lu' for floating
+        point LU decomposition. Defaults to 'bareiss' when every entry is
+        an int or Fraction, and to 'lu' otherwise.
 
     Raises:
         TypeError: If matrix is not a list of lists.
-        ValueError: If matrix is not square.
+        ValueError: If matrix is not square, or method is unknown.
 
     Returns:
         int or float: The determinant of the matrix.
@@ -34,6 +149,9 @@ def determinant(matrix):
     if len(matrix) == 0 or any(len(row) != len(matrix) for row in matrix):
         raise ValueError("matrix must be a square matrix")
 
+    if method not in (None, 'bareiss', 'lu'):
+        raise ValueError("method must be 'bareiss' or 'lu'")
+
     n = len(matrix)
 
     # Base case for 1x1 matrix
@@ -44,12 +162,8 @@ def determinant(matrix):
     if n == 2:
         return matrix[0][0]*matrix[1][1] - matrix[0][1]*matrix[1][0]
 
-    # Recursive case for nxn matrix
-    det = 0
-    for col in range(n):
-        # Create minor matrix by excluding first row and current column
-        minor = [row[:col] + row[col+1:] for row in matrix[1:]]
-        # Calculate cofactor and recurse
-        det += ((-1) ** col) * matrix[0][col] * determinant(minor)
-
-    return det
+    if method is None:
+        method = 'bareiss' if is_exact(matrix) else 'lu'
+    if method == 'bareiss':
+        return bareiss_determinant(matrix)
+    return lu_determinant(matrix)
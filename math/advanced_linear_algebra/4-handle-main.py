@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import random
+
+if __name__ == '__main__':
+    InverseHandle = __import__('inverse_handle').InverseHandle
+    inverse = __import__('4-inverse').inverse
+    determinant = __import__('0-determinant').determinant
+
+    def agrees(h, tol=1e-9):
+        """Compares the handle with a fresh factorization of its matrix."""
+        inv = inverse(h.matrix)
+        det = determinant(h.matrix)
+        if inv is None or h.inv is None:
+            return inv is None and h.inv is None and h.det == 0
+        return (abs(h.det - det) <= tol * max(1, abs(det)) and
+                all(abs(x - y) <= tol * max(1, abs(y))
+                    for row, ref in zip(h.inv, inv)
+                    for x, y in zip(row, ref)))
+
+    rng = random.Random(0)
+    n = 5
+    h = InverseHandle([[rng.uniform(-1, 1) + 3 * (i == j) for j in range(n)]
+                       for i in range(n)])
+    print(agrees(h))
+
+    checks = []
+    for step in range(30):
+        i, j = rng.randrange(n), rng.randrange(n)
+        kind = step % 3
+        if kind == 0:
+            h.update_row(i, [rng.uniform(-1, 1) + 3 * (i == k)
+                             for k in range(n)])
+        elif kind == 1:
+            h.update_column(j, [rng.uniform(-1, 1) + 3 * (j == k)
+                                for k in range(n)])
+        else:
+            h.update_entry(i, j, rng.uniform(-4, 4))
+        checks.append(agrees(h))
+    print(all(checks), h.refactorizations)
+
+    # Near singular then repaired: row 1 copied onto row 0, then restored
+    row = list(h.matrix[0])
+    h.update_row(0, list(h.matrix[1]))
+    print(agrees(h), abs(h.det) < 1e-12)
+    h.update_row(0, row)
+    print(agrees(h))
+
+    # Exactly singular then repaired
+    h = InverseHandle([[2, 1, 0], [1, 3, 1], [0, 1, 4]])
+    h.update_row(0, [1, 3, 1])
+    print(h.inv, h.det, agrees(h))
+    h.update_entry(0, 0, 5)
+    print(h.det, agrees(h))
+
+    # Badly scaled but invertible
+    h = InverseHandle([[1., 0, 0], [0, 1, 0], [0, 0, 1e-16]])
+    print(h.inv, h.det, agrees(h))
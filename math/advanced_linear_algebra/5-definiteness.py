@@ -1,57 +1,188 @@
 #!/usr/bin/env python3
 """
 This module provides a function to determine the definiteness
-of a symmetric matrix using its eigenvalues.
+of a symmetric matrix, or of a stack of symmetric matrices, using
+their eigenvalues.
 """
 
 
 import numpy as np
 
 
+LABELS = np.array([
+    "Positive definite",
+    "Positive semi-definite",
+    "Negative definite",
+    "Negative semi-definite",
+    "Indefinite",
+], dtype=object)
+
+# Cholesky is batched over chunks of CHUNK matrices, and failing chunks
+# are bisected down to blocks of MIN_BLOCK matrices
+CHUNK = 256
+MIN_BLOCK = 8
+
+
+def try_cholesky(stack, tol):
+    """
+    Factors a block of matrices with one batched Cholesky call.
+
+    Args:
+        stack (numpy.ndarray): Array of shape (k, n, n) of symmetric
+        matrices.
+        tol (numpy.ndarray): Array of shape (k,) of the smallest pivot
+        accepted for each matrix.
+
+    Returns:
+        numpy.ndarray or None: Boolean array of shape (k,) marking the
+        matrices with every pivot above tol, or None if the block holds
+        a matrix that is not positive definite.
+    """
+    try:
+        chol = np.linalg.cholesky(stack)
+    except np.linalg.LinAlgError:
+        return None
+    pivots = np.diagonal(chol, axis1=-2, axis2=-1) ** 2
+    return np.all(pivots > tol[:, None], axis=-1)
+
+
+def isolate(stack, tol):
+    """
+    Finds the positive definite matrices of a block that failed Cholesky.
+
+    The block is bisected and each half retried, so a single bad matrix
+    costs two calls per level. If both halves fail the failures are not
+    rare, and the block is left to eigvalsh rather than split further.
+
+    Args:
+        stack (numpy.ndarray): Array of shape (k, n, n) of symmetric
+        matrices, at least one of them not positive definite.
+        tol (numpy.ndarray): Array of shape (k,) of pivot tolerances.
+
+    Returns:
+        numpy.ndarray: Boolean array of shape (k,).
+    """
+    if len(stack) <= MIN_BLOCK:
+        return np.zeros(len(stack), dtype=bool)
+    half = len(stack) // 2
+    parts = [(stack[:half], tol[:half]), (stack[half:], tol[half:])]
+    masks = [try_cholesky(*part) for part in parts]
+    if masks[0] is None and masks[1] is None:
+        return np.zeros(len(stack), dtype=bool)
+    return np.concatenate([
+        isolate(*part) if mask is None else mask
+        for part, mask in zip(parts, masks)])
+
+
+def cholesky_sure(stack, tol):
+    """
+    Finds the matrices of a stack that Cholesky proves positive definite.
+
+    A batched factorization fails as a whole if any one matrix is not
+    positive definite, so the stack is factored in chunks of CHUNK and
+    a failing chunk is narrowed down by isolate. A stray non-positive
+    definite matrix thus only costs the fast path its own small block.
+
+    Args:
+        stack (numpy.ndarray): Array of shape (k, n, n) of symmetric
+        matrices.
+        tol (numpy.ndarray): Array of shape (k,) of pivot tolerances.
+
+    Returns:
+        numpy.ndarray: Boolean array of shape (k,).
+    """
+    sure = np.zeros(len(stack), dtype=bool)
+    for start in range(0, len(stack), CHUNK):
+        chunk = slice(start, start + CHUNK)
+        mask = try_cholesky(stack[chunk], tol[chunk])
+        sure[chunk] = isolate(stack[chunk], tol[chunk]) if mask is None \
+            else mask
+    return sure
+
+
+def classify(stack):
+    """
+    Classifies a stack of symmetric matrices in one batched call.
+
+    Batched Cholesky factorizations are tried first: every matrix they
+    factor with pivots clear of roundoff is positive definite and needs
+    no eigendecomposition. Failing chunks are narrowed down (see
+    cholesky_sure), so a stray bad matrix only sends its own small block
+    to the single batched `eigvalsh` call that decides the rest.
+
+    Args:
+        stack (numpy.ndarray): Array of shape (k, n, n) of symmetric
+        matrices.
+
+    Returns:
+        numpy.ndarray: Object array of shape (k,) with the labels, or
+        None entries if the eigenvalues could not be computed.
+    """
+    labels = np.full(stack.shape[0], None, dtype=object)
+    if stack.shape[0] == 0:
+        return labels
+
+    # Cholesky pivots within roundoff of zero are left to eigvalsh
+    scale = np.abs(stack).max(axis=(-2, -1), initial=0)
+    tol = stack.shape[-1] * np.finfo(float).eps * scale
+    sure = cholesky_sure(stack, tol)
+    labels[sure] = LABELS[0]
+    rest = ~sure
+    if not rest.any():
+        return labels
+
+    try:
+        eigvals = np.linalg.eigvalsh(stack[rest])
+    except np.linalg.LinAlgError:
+        return labels
+
+    code = np.select([
+        np.all(eigvals > 0, axis=-1),
+        np.all(eigvals >= 0, axis=-1),
+        np.all(eigvals < 0, axis=-1),
+        np.all(eigvals <= 0, axis=-1),
+    ], [0, 1, 2, 3], default=4)
+    labels[rest] = LABELS[code]
+    return labels
+
+
 def definiteness(matrix):
     """
     Determines the definiteness of a real symmetric matrix.
 
     Args:
-        matrix (numpy.ndarray): A 2D NumPy array.
+        matrix (numpy.ndarray): A 2D NumPy array, or a stack of square
+        matrices of shape (..., n, n).
 
     Returns:
-        str or None: One of the following strings if the matrix is symmetric:
+        str or None: For a 2D array, one of the following strings if the
+        matrix is symmetric:
             - "Positive definite"
             - "Positive semi-definite"
             - "Negative definite"
             - "Negative semi-definite"
             - "Indefinite"
         Otherwise, returns None.
+        For a stack, an object array of shape matrix.shape[:-2] holding
+        the label (or None) of each matrix.
     """
     if not isinstance(matrix, np.ndarray):
         raise TypeError("matrix must be a numpy.ndarray")
-    # Check if matrix is square and 2D
-    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+    # Check if matrix is square and at least 2D
+    if matrix.ndim < 2 or matrix.shape[-1] != matrix.shape[-2]:
         return None
 
-    # Check if matrix is symmetric
-    if not np.allclose(matrix, matrix.T):
-        return None
+    n = matrix.shape[-1]
+    batch = matrix.shape[:-2]
+    stack = matrix.reshape((int(np.prod(batch)), n, n))
 
-    # Compute eigenvalues
-    try:
-        eigvals = np.linalg.eigvalsh(matrix)
-    except np.linalg.LinAlgError:
-        return None
+    # Check symmetry of every matrix at once
+    symmetric = np.all(
+        np.isclose(stack, np.swapaxes(stack, -1, -2)), axis=(-2, -1))
+
+    labels = np.full(stack.shape[0], None, dtype=object)
+    labels[symmetric] = classify(stack[symmetric])
 
-    pos = np.all(eigvals > 0)
-    pos_semi = np.all(eigvals >= 0)
-    neg = np.all(eigvals < 0)
-    neg_semi = np.all(eigvals <= 0)
-
-    if pos:
-        return "Positive definite"
-    if pos_semi:
-        return "Positive semi-definite"
-    if neg:
-        return "Negative definite"
-    if neg_semi:
-        return "Negative semi-definite"
-
-    return "Indefinite"
+    if matrix.ndim == 2:
+        return labels[0]
+    return labels.reshape(batch)
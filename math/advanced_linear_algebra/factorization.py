@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+This module contains the shared elimination core used by `minor`,
+`cofactor`, `adjugate` and `inverse`.
+
+The matrix is factored once with Gauss-Jordan elimination on [A | I],
+which yields both det(A) and A^-1 in O(n^3). The adjugate then follows
+from adj(A) = det(A) * A^-1, and the minor and cofactor matrices from the
+adjugate. Singular matrices have no inverse, so their adjugate is rebuilt
+from the null spaces of A and A^T instead.
+
+When a `MinorCache` is passed, the minors are instead computed exactly by
+memoized Laplace expansion, reusing sub-determinants across calls.
+"""
+from fractions import Fraction
+import sys
+
+determinant = __import__('0-determinant').determinant
+is_exact = __import__('0-determinant').is_exact
+
+
+def check_matrix(matrix):
+    """
+    Validates that matrix is a non-empty square list of lists.
+
+    Args:
+        matrix (list of lists): The matrix to validate.
+
+    Raises:
+        TypeError: If matrix is not a list of lists.
+        ValueError: If matrix is not a non-empty square matrix.
+    """
+    if (
+        not isinstance(matrix, list) or
+        not all(isinstance(row, list) for row in matrix)
+    ):
+        raise TypeError("matrix must be a list of lists")
+    if len(matrix) == 0 or any(len(row) != len(matrix) for row in matrix):
+        raise ValueError("matrix must be a non-empty square matrix")
+
+
+def to_number(value, exact):
+    """
+    Converts an entry to the working number type of the elimination.
+
+    Args:
+        value: The entry to convert.
+        exact (bool): Whether exact Fraction arithmetic is used.
+
+    Returns:
+        Fraction or float: The converted entry.
+    """
+    return Fraction(value) if exact else float(value)
+
+
+def from_number(value):
+    """
+    Converts an exact result back to an int when it is integral.
+
+    Args:
+        value (Fraction or float): The value to convert.
+
+    Returns:
+        int, Fraction or float: The simplified value.
+    """
+    if isinstance(value, Fraction) and value.denominator == 1:
+        return value.numerator
+    return value
+
+
+def scales(matrix, exact):
+    """
+    Returns the row and column scales that pivots are measured against.
+
+    Args:
+        matrix (list of lists): The matrix being reduced.
+        exact (bool): Whether exact Fraction arithmetic is used.
+
+    Returns:
+        tuple: (rows, cols) lists of max |a_ij| along each row and column,
+        or None in exact mode, where only a zero pivot is singular.
+    """
+    if exact:
+        return None
+    return ([max(abs(x) for x in row) for row in matrix],
+            [max(abs(x) for x in col) for col in zip(*matrix)])
+
+
+def negligible(pivot, row_scale, col_scale, n):
+    """
+    Tells whether a pivot is zero up to the rounding of the elimination.
+
+    The pivot is compared with n * eps times the smaller of the scales of
+    the original row it came from and of its column, so scaling a row or
+    a column of an invertible matrix never makes it look singular.
+
+    Args:
+        pivot (float): The pivot candidate.
+        row_scale (float): max |a_ij| of the pivot's original row.
+        col_scale (float): max |a_ij| of the pivot's column.
+        n (int): The order of the matrix.
+
+    Returns:
+        bool: True if the pivot is treated as zero.
+    """
+    return abs(pivot) <= n * sys.float_info.epsilon * min(row_scale,
+                                                          col_scale)
+
+
+def gauss_jordan(matrix, exact):
+    """
+    Factors a square matrix once with Gauss-Jordan elimination.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix.
+        exact (bool): Use Fraction arithmetic instead of floats.
+
+    Returns:
+        tuple: (det, inv) where inv is the inverse as a list of lists, or
+        None when the matrix is singular (in which case det is 0).
+    """
+    n = len(matrix)
+    zero = to_number(0, exact)
+    one = to_number(1, exact)
+    aug = [
+        [to_number(x, exact) for x in row] +
+        [one if i == j else zero for j in range(n)]
+        for i, row in enumerate(matrix)
+    ]
+    det = one
+    scale = scales(matrix, exact)
+    # Original row index of each row of aug
+    order = list(range(n))
+
+    for k in range(n):
+        if exact:
+            p = next((r for r in range(k, n) if aug[r][k] != 0), None)
+        else:
+            p = max(range(k, n), key=lambda r: abs(aug[r][k]))
+        if p is None or scale and negligible(
+                aug[p][k], scale[0][order[p]], scale[1][k], n):
+            return zero, None
+        if p != k:
+            aug[k], aug[p] = aug[p], aug[k]
+            order[k], order[p] = order[p], order[k]
+            det = -det
+        pivot = aug[k][k]
+        det *= pivot
+        pivot_row = [x / pivot for x in aug[k]]
+        aug[k] = pivot_row
+        for i in range(n):
+            if i == k:
+                continue
+            row = aug[i]
+            factor = row[k]
+            if factor:
+                aug[i] = [a - factor * b for a, b in zip(row, pivot_row)]
+
+    return det, [row[n:] for row in aug]
+
+
+def null_vector(matrix, exact):
+    """
+    Finds a non-zero vector x with matrix x = 0 by row reduction.
+
+    Args:
+        matrix (list of lists): A square matrix.
+        exact (bool): Use Fraction arithmetic instead of floats.
+
+    Returns:
+        tuple: (rank, x) where x is a null vector built from the first
+        free column of the reduced row echelon form, or None if the
+        matrix reduced to full rank.
+    """
+    n = len(matrix)
+    mat = [[to_number(x, exact) for x in row] for row in matrix]
+    scale = scales(matrix, exact)
+    order = list(range(n))
+    pivots = []
+    r = 0
+    for c in range(n):
+        if r == n:
+            break
+        if exact:
+            p = next((i for i in range(r, n) if mat[i][c] != 0), None)
+        else:
+            p = max(range(r, n), key=lambda i: abs(mat[i][c]))
+        if p is None or scale and negligible(
+                mat[p][c], scale[0][order[p]], scale[1][c], n):
+            continue
+        mat[r], mat[p] = mat[p], mat[r]
+        order[r], order[p] = order[p], order[r]
+        pivot_row = [x / mat[r][c] for x in mat[r]]
+        mat[r] = pivot_row
+        for i in range(n):
+            factor = mat[i][c]
+            if i != r and factor:
+                mat[i] = [a - factor * b for a, b in zip(mat[i], pivot_row)]
+        pivots.append(c)
+        r += 1
+
+    free = next((c for c in range(n) if c not in pivots), None)
+    if free is None:
+        return n, None
+    x = [to_number(0, exact)] * n
+    x[free] = to_number(1, exact)
+    for row, c in enumerate(pivots):
+        x[c] = -mat[row][free]
+    return len(pivots), x
+
+
+def cofactor_adjugate(matrix, exact):
+    """
+    Calculates the adjugate entry by entry from (n - 1) x (n - 1)
+    determinants, in O(n^5).
+
+    Args:
+        matrix (list of lists): A square matrix with n >= 2.
+        exact (bool): Use Fraction arithmetic instead of floats.
+
+    Returns:
+        list of lists: The adjugate matrix.
+    """
+    n = len(matrix)
+    # adj(A)[i][j] is the (j, i) cofactor of A
+    return [[(-1) ** (i + j) * to_number(determinant(
+        [row[:i] + row[i+1:] for r, row in enumerate(matrix) if r != j]),
+        exact) for j in range(n)] for i in range(n)]
+
+
+def singular_adjugate(matrix, exact):
+    """
+    Calculates the adjugate of a singular matrix.
+
+    If rank(A) < n - 1 every minor vanishes. If rank(A) = n - 1 the
+    adjugate has rank one, adj(A) = k * x y^T with A x = 0 and y^T A = 0,
+    and k is fixed by a single (n - 1) x (n - 1) determinant.
+
+    The rank is decided on A alone. In floating point A^T may still
+    reduce to full rank, in which case y does not exist and the
+    adjugate is computed from its cofactors instead.
+
+    Args:
+        matrix (list of lists): A singular square matrix with n >= 2.
+        exact (bool): Use Fraction arithmetic instead of floats.
+
+    Returns:
+        list of lists: The adjugate matrix.
+    """
+    n = len(matrix)
+    zero = to_number(0, exact)
+    rank, x = null_vector(matrix, exact)
+    if rank < n - 1:
+        return [[zero] * n for _ in range(n)]
+    _, y = null_vector([list(col) for col in zip(*matrix)], exact)
+    if x is None or y is None:
+        return cofactor_adjugate(matrix, exact)
+
+    i = max(range(n), key=lambda r: abs(x[r]))
+    j = max(range(n), key=lambda c: abs(y[c]))
+    # adj(A)[i][j] is the (j, i) cofactor of A
+    sub = [row[:i] + row[i+1:] for r, row in enumerate(matrix) if r != j]
+    cof = (-1) ** (i + j) * to_number(determinant(sub), exact)
+    k = cof / (x[i] * y[j])
+    return [[k * xi * yj for yj in y] for xi in x]
+
+
+def factor(matrix):
+    """
+    Factors a validated matrix once and derives its adjugate and inverse.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix.
+
+    Returns:
+        tuple: (det, adj, inv) in the working number type, where inv is
+        None for a singular matrix.
+    """
+    exact = is_exact(matrix)
+    n = len(matrix)
+    if n == 1:
+        det = to_number(matrix[0][0], exact)
+        inv = [[1 / det]] if det != 0 else None
+        return det, [[to_number(1, exact)]], inv
+
+    det, inv = gauss_jordan(matrix, exact)
+    if inv is None:
+        return det, singular_adjugate(matrix, exact), None
+    adj = [[det * x for x in row] for row in inv]
+    return det, adj, inv
+
+
+def adjugate_matrix(matrix, cache=None):
+    """
+    Calculates the adjugate of a validated matrix.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix.
+        cache (MinorCache): Optional memo of sub-determinants.
+
+    Returns:
+        list of lists: The adjugate matrix.
+    """
+    if cache is not None:
+        cof = cofactor_matrix(matrix, cache)
+        return [list(col) for col in zip(*cof)]
+    _, adj, _ = factor(matrix)
+    return [[from_number(x) for x in row] for row in adj]
+
+
+def apply_signs(matrix):
+    """
+    Flips the sign of every entry whose row and column indices sum to an
+    odd number, mapping minors to cofactors and back.
+
+    Args:
+        matrix (list of lists): A square matrix.
+
+    Returns:
+        list of lists: The signed matrix.
+    """
+    return [
+        [x if (i + j) % 2 == 0 or not x else -x for j, x in enumerate(row)]
+        for i, row in enumerate(matrix)
+    ]
+
+
+def cofactor_matrix(matrix, cache=None):
+    """
+    Calculates the cofactor matrix of a validated matrix.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix.
+        cache (MinorCache): Optional memo of sub-determinants.
+
+    Returns:
+        list of lists: The cofactor matrix, the transpose of adj(A).
+    """
+    if cache is not None:
+        return apply_signs(cache.minors(matrix))
+    adj = adjugate_matrix(matrix)
+    return [list(col) for col in zip(*adj)]
+
+
+def minor_matrix(matrix, cache=None):
+    """
+    Calculates the minor matrix of a validated matrix.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix.
+        cache (MinorCache): Optional memo of sub-determinants.
+
+    Returns:
+        list of lists: The minor matrix.
+    """
+    if cache is not None:
+        return cache.minors(matrix)
+    return apply_signs(cofactor_matrix(matrix))
+
+
+def inverse_matrix(matrix):
+    """
+    Calculates the inverse of a validated matrix.
+
+    Args:
+        matrix (list of lists): A non-empty square matrix.
+
+    Returns:
+        list of lists or None: The inverse, or None if the matrix is
+        singular. Integer and float input give floats, Fraction input
+        gives Fractions.
+    """
+    _, _, inv = factor(matrix)
+    if inv is None:
+        return None
+    if any(isinstance(x, Fraction) for row in matrix for x in row):
+        return inv
+    return [[float(x) for x in row] for row in inv]
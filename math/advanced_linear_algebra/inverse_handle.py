@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+This module contains the class `InverseHandle`, which keeps the inverse
+and determinant of a square matrix current under rank-1 updates.
+"""
+factorization = __import__('factorization')
+
+
+class InverseHandle:
+    """
+    Holds a matrix together with its inverse and determinant.
+
+    An update A' = A + u v^T is applied in O(n^2) with the
+    Sherman-Morrison formula
+
+        A'^-1 = A^-1 - (A^-1 u)(v^T A^-1) / (1 + v^T A^-1 u)
+
+    and the matrix determinant lemma det(A') = (1 + v^T A^-1 u) det(A).
+    When the denominator is too close to zero (the update is numerically
+    singular) or so large that the update would cancel most of A^-1,
+    when the matrix is singular, or after `refresh` updates have
+    accumulated, the handle refactors from scratch with
+    `factorization.factor`, which yields the inverse and determinant of
+    one elimination so the two always agree.
+    """
+
+    def __init__(self, matrix, tol=1e-10, refresh=64):
+        """
+        Builds the handle from a full factorization of matrix.
+
+        Args:
+            matrix (list of lists): A non-empty square matrix.
+            tol (float): Relative threshold on |1 + v^T A^-1 u| below
+            which an update triggers a refactorization.
+            refresh (int): Number of updates after which the inverse is
+            recomputed to discard accumulated rounding error.
+        """
+        factorization.check_matrix(matrix)
+        self.matrix = [[float(x) for x in row] for row in matrix]
+        self.n = len(matrix)
+        self.tol = tol
+        self.refresh = refresh
+        self.refactorizations = 0
+        self.factorize()
+
+    def factorize(self):
+        """Takes the inverse and determinant from one factorization."""
+        det, _, inv = factorization.factor(self.matrix)
+        self.det = float(det)
+        self.inv = None if inv is None else [[float(x) for x in row]
+                                             for row in inv]
+        self.updates = 0
+
+    def refactor(self):
+        """Recomputes the inverse and determinant from the matrix."""
+        self.factorize()
+        self.refactorizations += 1
+
+    def check_vector(self, vector, name):
+        """
+        Validates an update vector.
+
+        Args:
+            vector (list): The vector to validate.
+            name (str): The argument name used in error messages.
+
+        Raises:
+            TypeError: If vector is not a list.
+            ValueError: If vector does not have n entries.
+        """
+        if not isinstance(vector, list):
+            raise TypeError("{} must be a list".format(name))
+        if len(vector) != self.n:
+            raise ValueError("{} must have {} entries".format(name, self.n))
+
+    def rank1_update(self, u, v):
+        """
+        Applies A <- A + u v^T and updates the inverse and determinant.
+
+        Args:
+            u (list): Column vector of length n.
+            v (list): Row vector of length n.
+        """
+        self.check_vector(u, "u")
+        self.check_vector(v, "v")
+        n = self.n
+        for i in range(n):
+            if u[i]:
+                row = self.matrix[i]
+                for j in range(n):
+                    row[j] += u[i] * v[j]
+
+        inv = self.inv
+        self.updates += 1
+        if inv is None or self.updates >= self.refresh:
+            self.refactor()
+            return
+
+        # a = A^-1 u, b^T = v^T A^-1
+        a = [sum(x * y for x, y in zip(row, u)) for row in inv]
+        b = [sum(v[k] * inv[k][j] for k in range(n) if v[k])
+             for j in range(n)]
+        denom = 1 + sum(x * y for x, y in zip(v, a))
+        scale = 1 + (sum(x * x for x in v) * sum(x * x for x in a)) ** 0.5
+        # |denom| = |det(A') / det(A)|: near zero the update is singular,
+        # and far above one the update cancels most of A^-1 and would
+        # lose about log10 |denom| digits of it
+        if not self.tol * scale < abs(denom) < self.tol ** -0.5:
+            self.refactor()
+            return
+
+        for i in range(n):
+            if a[i]:
+                factor = a[i] / denom
+                row = inv[i]
+                for j in range(n):
+                    row[j] -= factor * b[j]
+        self.det *= denom
+
+    def update_row(self, i, row):
+        """
+        Replaces row i of the matrix.
+
+        Args:
+            i (int): The row index.
+            row (list): The new row of length n.
+        """
+        self.check_vector(row, "row")
+        u = [0.0] * self.n
+        u[i] = 1.0
+        self.rank1_update(u, [x - y for x, y in zip(row, self.matrix[i])])
+
+    def update_column(self, j, column):
+        """
+        Replaces column j of the matrix.
+
+        Args:
+            j (int): The column index.
+            column (list): The new column of length n.
+        """
+        self.check_vector(column, "column")
+        v = [0.0] * self.n
+        v[j] = 1.0
+        old = [row[j] for row in self.matrix]
+        self.rank1_update([x - y for x, y in zip(column, old)], v)
+
+    def update_entry(self, i, j, value):
+        """
+        Replaces the entry (i, j) of the matrix.
+
+        Args:
+            i (int): The row index.
+            j (int): The column index.
+            value (int or float): The new entry.
+        """
+        u = [0.0] * self.n
+        u[i] = 1.0
+        v = [0.0] * self.n
+        v[j] = value - self.matrix[i][j]
+        self.rank1_update(u, v)
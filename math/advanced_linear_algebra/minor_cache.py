@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+This module contains the class `MinorCache`, a bounded LRU memo of
+sub-determinants used by `minor`, `cofactor` and `adjugate`.
+"""
+from collections import OrderedDict
+
+
+class MinorCache:
+    """
+    Memoizes the sub-determinants of one matrix by exclusion masks.
+
+    A sub-determinant is keyed by (rows_mask, cols_mask), the bitmasks of
+    the rows and columns removed from the matrix. Laplace expansion along
+    the first remaining row then shares its subproblems, so the whole
+    minor matrix costs O(2^n * n) exact operations instead of O(n!).
+
+    The cache remembers the matrix it was last used with: when an entry
+    (r, c) changes, only the sub-determinants that still contain row r
+    and column c are evicted, so the others are reused.
+    """
+
+    def __init__(self, maxsize=65536):
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of stored sub-determinants,
+            least recently used entries are evicted first.
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.entries = OrderedDict()
+        self.snapshot = None
+
+    def __len__(self):
+        """Returns the number of stored sub-determinants."""
+        return len(self.entries)
+
+    def clear(self):
+        """Drops every stored sub-determinant and resets the counters."""
+        self.entries.clear()
+        self.snapshot = None
+        self.hits = 0
+        self.misses = 0
+
+    def sync(self, matrix):
+        """
+        Evicts the sub-determinants invalidated by edits to matrix.
+
+        Args:
+            matrix (list of lists): The square matrix about to be used.
+        """
+        old = self.snapshot
+        self.snapshot = [list(row) for row in matrix]
+        if old is None or len(old) != len(matrix):
+            self.entries.clear()
+            return
+        changed = [
+            (1 << r, 1 << c)
+            for r, (row, old_row) in enumerate(zip(matrix, old))
+            for c, (x, y) in enumerate(zip(row, old_row)) if x != y
+        ]
+        if not changed:
+            return
+        for key in list(self.entries):
+            rows_mask, cols_mask = key
+            if any(not rows_mask & r and not cols_mask & c
+                   for r, c in changed):
+                del self.entries[key]
+
+    def determinant(self, matrix, rows_mask, cols_mask):
+        """
+        Calculates the determinant of matrix without the masked rows and
+        columns, by memoized Laplace expansion.
+
+        Args:
+            matrix (list of lists): The square matrix.
+            rows_mask (int): Bitmask of the excluded rows.
+            cols_mask (int): Bitmask of the excluded columns.
+
+        Returns:
+            int or float: The sub-determinant.
+        """
+        key = (rows_mask, cols_mask)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+
+        n = len(matrix)
+        r = next((i for i in range(n) if not rows_mask >> i & 1), None)
+        if r is None:
+            det = 1
+        else:
+            det = 0
+            sign = 1
+            for c in range(n):
+                if cols_mask >> c & 1:
+                    continue
+                if matrix[r][c]:
+                    det += sign * matrix[r][c] * self.determinant(
+                        matrix, rows_mask | 1 << r, cols_mask | 1 << c)
+                sign = -sign
+
+        self.entries[key] = det
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return det
+
+    def minors(self, matrix):
+        """
+        Calculates the minor matrix of a validated matrix.
+
+        Args:
+            matrix (list of lists): A non-empty square matrix.
+
+        Returns:
+            list of lists: The minor matrix.
+        """
+        self.sync(matrix)
+        n = len(matrix)
+        return [
+            [self.determinant(matrix, 1 << i, 1 << j) for j in range(n)]
+            for i in range(n)
+        ]
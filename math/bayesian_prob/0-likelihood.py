@@ -1,34 +1,108 @@
 #!/usr/bin/env python3
 """
 Calculates the likelihood of obtaining data given various probabilities.
+
+x and n may also be 1D arrays describing several experiments, in which
+case one row of likelihoods is returned per experiment. Likelihoods are
+computed in log space with lgamma, so large n neither needs big-integer
+factorials nor overflows.
 """
+import math
+
 import numpy as np  # type: ignore
 
 
+def check_data(x, n):
+    """
+    Validates the data of one experiment or a batch of experiments.
+
+    Parameters:
+    - x: number of patients with severe side effects, an int or a 1D
+      array of ints
+    - n: total number of patients, an int or a 1D array of ints
+
+    Returns:
+    - tuple (x, n) as arrays of shape () or (num_experiments,)
+    """
+    if np.ndim(x) or np.ndim(n):
+        x = np.asarray(x)
+        n = np.asarray(n)
+        if n.ndim > 1 or not np.issubdtype(n.dtype, np.integer) or \
+                np.any(n <= 0):
+            raise ValueError("n must be a positive integer")
+        if x.ndim > 1 or not np.issubdtype(x.dtype, np.integer) or \
+                np.any(x < 0):
+            raise ValueError(
+                "x must be an integer that is greater than or equal to 0"
+                )
+        x, n = np.broadcast_arrays(x, n)
+    else:
+        if not isinstance(n, int) or n <= 0:
+            raise ValueError("n must be a positive integer")
+
+        if not isinstance(x, int) or x < 0:
+            raise ValueError(
+                "x must be an integer that is greater than or equal to 0"
+                )
+        x = np.asarray(x)
+        n = np.asarray(n)
+
+    if np.any(x > n):
+        raise ValueError("x cannot be greater than n")
+
+    return x, n
+
+
+def log_likelihood(x, n, P):
+    """
+    Calculates the log likelihood of the data for each probability in P,
+    without validating the inputs.
+
+    Parameters:
+    - x: np.ndarray of shape () or (num_experiments,) of successes
+    - n: np.ndarray of the same shape as x of trials
+    - P: 1D numpy.ndarray of hypothetical probabilities
+
+    Returns:
+    - np.ndarray of shape x.shape + P.shape of log likelihoods
+    """
+    lgamma = np.frompyfunc(math.lgamma, 1, 1)
+    log_coeff = np.asarray(lgamma(n + 1) - lgamma(x + 1) -
+                           lgamma(n - x + 1), dtype=float)
+    x = x.astype(float)
+    failures = n - x
+    with np.errstate(divide='ignore'):
+        log_p = np.log(P)
+        log_q = np.log1p(-P)
+    # All experiments at once as one matrix product:
+    # [log_coeff, x, n - x] @ [1, log(P), log(1 - P)]
+    terms = np.stack([log_coeff, x, failures], axis=-1)
+    logs = np.stack([np.ones_like(log_p), np.where(P > 0, log_p, 0.),
+                     np.where(P < 1, log_q, 0.)])
+    result = terms @ logs
+    # P = 0 and P = 1 have likelihood 1 when x = 0 and x = n, else 0
+    result[..., P == 0] = np.where(x > 0, -np.inf, 0.)[..., np.newaxis]
+    result[..., P == 1] = np.where(failures > 0, -np.inf, 0.)[
+        ..., np.newaxis]
+    return result
+
+
 def likelihood(x, n, P):
     """
     Calculates the likelihood of obtaining the data x and n
     for each probability in P.
 
     Parameters:
-    - x: number of patients with severe side effects
-    - n: total number of patients
+    - x: number of patients with severe side effects, or a 1D array of
+      them for several experiments
+    - n: total number of patients, or a 1D array of them
     - P: 1D numpy.ndarray of hypothetical probabilities
 
     Returns:
-    - 1D numpy.ndarray of likelihoods for each probability in P
+    - 1D numpy.ndarray of likelihoods for each probability in P, or a
+      (num_experiments, len(P)) array for batched x and n
     """
-    # Input validation
-    if not isinstance(n, int) or n <= 0:
-        raise ValueError("n must be a positive integer")
-
-    if not isinstance(x, int) or x < 0:
-        raise ValueError(
-            "x must be an integer that is greater than or equal to 0"
-            )
-
-    if x > n:
-        raise ValueError("x cannot be greater than n")
+    x, n = check_data(x, n)
 
     if not isinstance(P, np.ndarray) or len(P.shape) != 1:
         raise TypeError("P must be a 1D numpy.ndarray")
@@ -36,15 +110,4 @@ def likelihood(x, n, P):
     if np.any((P < 0) | (P > 1)):
         raise ValueError("All values in P must be in the range [0, 1]")
 
-    def factorial(n):
-        """Returns the factorial of n."""
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
-
-    # Likelihood calculation
-    binom_coeff = factorial(n) // (factorial(x) * factorial(n - x))
-    likelihoods = binom_coeff * (P ** x) * ((1 - P) ** (n - x))
-
-    return likelihoods.astype(float)
+    return np.exp(log_likelihood(x, n, P))
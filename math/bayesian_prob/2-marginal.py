@@ -5,32 +5,57 @@ Calculates the marginal probability of obtaining the data.
 """
 
 import numpy as np  # type: ignore
-likelihood = __import__('0-likelihood').likelihood
+check_data = __import__('0-likelihood').check_data
+log_likelihood = __import__('0-likelihood').log_likelihood
 
 
-def marginal(x, n, P, Pr):
+def log_sum_exp(a):
     """
-    Calculates the marginal probability of obtaining the data x and n.
+    Calculates log(sum(exp(a))) over the last axis without underflow.
+
+    Parameters:
+    - a (np.ndarray): log values, -inf allowed
+
+    Returns:
+    - np.ndarray: the reduced log sums
+    """
+    top = np.max(a, axis=-1, keepdims=True)
+    top = np.where(np.isfinite(top), top, 0.)
+    return np.log(np.sum(np.exp(a - top), axis=-1)) + top[..., 0]
+
+
+def log_joint(x, n, P, Pr):
+    """
+    Calculates log(likelihood * prior) of validated inputs.
 
     Parameters:
-    - x (int): number of patients with severe side effects
-    - n (int): total number of patients
+    - x, n (np.ndarray): data of shape () or (num_experiments,)
     - P (np.ndarray): 1D array of hypothetical probabilities
     - Pr (np.ndarray): 1D array of prior beliefs of P
 
     Returns:
-    - float: marginal probability of observing x out of n
+    - np.ndarray of shape x.shape + P.shape
     """
-    if not isinstance(n, int) or n <= 0:
-        raise ValueError("n must be a positive integer")
+    with np.errstate(divide='ignore'):
+        return log_likelihood(x, n, P) + np.log(Pr)
 
-    if not isinstance(x, int) or x < 0:
-        raise ValueError(
-            "x must be an integer that is greater than or equal to 0"
-            )
 
-    if x > n:
-        raise ValueError("x cannot be greater than n")
+def marginal(x, n, P, Pr):
+    """
+    Calculates the marginal probability of obtaining the data x and n.
+
+    Parameters:
+    - x (int or np.ndarray): number of patients with severe side effects,
+      or a 1D array of them for several experiments
+    - n (int or np.ndarray): total number of patients, or a 1D array
+    - P (np.ndarray): 1D array of hypothetical probabilities
+    - Pr (np.ndarray): 1D array of prior beliefs of P
+
+    Returns:
+    - float: marginal probability of observing x out of n, or a
+      (num_experiments,) array for batched x and n
+    """
+    x, n = check_data(x, n)
 
     if not isinstance(P, np.ndarray) or P.ndim != 1:
         raise TypeError("P must be a 1D numpy.ndarray")
@@ -48,4 +73,4 @@ def marginal(x, n, P, Pr):
         raise ValueError("Pr must sum to 1")
 
     # Compute marginal: sum of intersection (likelihood * prior)
-    return np.sum(likelihood(x, n, P) * Pr)
+    return np.exp(log_sum_exp(log_joint(x, n, P, Pr)))
@@ -5,8 +5,9 @@ Calculates the posterior probability of each hypothetical P given the data.
 """
 
 import numpy as np  # type: ignore
-likelihood = __import__('0-likelihood').likelihood
-marginal = __import__('2-marginal').marginal
+check_data = __import__('0-likelihood').check_data
+log_joint = __import__('2-marginal').log_joint
+log_sum_exp = __import__('2-marginal').log_sum_exp
 
 
 def posterior(x, n, P, Pr):
@@ -15,24 +16,17 @@ def posterior(x, n, P, Pr):
     probabilities of developing severe side effects given the data.
 
     Parameters:
-    - x (int): number of patients with severe side effects
-    - n (int): total number of patients
+    - x (int or np.ndarray): number of patients with severe side effects,
+      or a 1D array of them for several experiments
+    - n (int or np.ndarray): total number of patients, or a 1D array
     - P (np.ndarray): 1D array of hypothetical probabilities
     - Pr (np.ndarray): 1D array of prior beliefs of P
 
     Returns:
-    - np.ndarray: posterior probability for each probability in P
+    - np.ndarray: posterior probability for each probability in P, or
+      a (num_experiments, len(P)) array for batched x and n
     """
-    if not isinstance(n, int) or n <= 0:
-        raise ValueError("n must be a positive integer")
-
-    if not isinstance(x, int) or x < 0:
-        raise ValueError(
-            "x must be an integer that is greater than or equal to 0"
-            )
-
-    if x > n:
-        raise ValueError("x cannot be greater than n")
+    x, n = check_data(x, n)
 
     if not isinstance(P, np.ndarray) or P.ndim != 1:
         raise TypeError("P must be a 1D numpy.ndarray")
@@ -49,9 +43,7 @@ def posterior(x, n, P, Pr):
     if not np.isclose(np.sum(Pr), 1):
         raise ValueError("Pr must sum to 1")
 
-    # Posterior = (Likelihood * Prior) / Marginal
-    likelihood_vals = likelihood(x, n, P)
-    marginal_val = marginal(x, n, P, Pr)
-    posterior_vals = likelihood_vals * Pr / marginal_val
-
-    return posterior_vals
+    # Posterior = (Likelihood * Prior) / Marginal, in log space with the
+    # likelihood computed once for both
+    joint = log_joint(x, n, P, Pr)
+    return np.exp(joint - log_sum_exp(joint)[..., np.newaxis])
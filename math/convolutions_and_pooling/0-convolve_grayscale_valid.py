@@ -2,32 +2,29 @@
 """Performs a valid convolution on grayscale images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def convolve_grayscale_valid(images, kernel):
+def convolve_grayscale_valid(images, kernel, dtype=float,
+                             accumulate_dtype=None):
     """
     Performs a valid convolution on grayscale images.
 
     Args:
         images (np.ndarray): shape (m, h, w) multiple grayscale images.
         kernel (np.ndarray): shape (kh, kw), the convolution kernel.
+        dtype: dtype of the output, float64 by default.
+        accumulate_dtype: dtype the sums are computed in, by default
+            dtype itself (float64 for non-float dtypes).
 
     Returns:
         np.ndarray: the convolved images with shape (m, h-kh+1, w-kw+1).
     """
-    m, h, w = images.shape
-    kh, kw = kernel.shape
-
-    out_h = h - kh + 1
-    out_w = w - kw + 1
-
-    output = np.zeros((m, out_h, out_w))
-
-    for i in range(out_h):
-        for j in range(out_w):
-            output[:, i, j] = np.sum(
-                images[:, i:i + kh, j:j + kw] * kernel,
-                axis=(1, 2)
-            )
-
-    return output
+    images, kernel = conv_engine.cast_inputs(
+        images, kernel, dtype, accumulate_dtype
+    )
+    output = conv_engine.convolve_padded(
+        images[..., np.newaxis], kernel[:, :, np.newaxis, np.newaxis], (1, 1)
+    )
+
+    return conv_engine.to_dtype(output[..., 0], dtype)
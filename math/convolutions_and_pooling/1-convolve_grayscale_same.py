@@ -2,34 +2,41 @@
 """Performs a valid convolution on grayscale images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def convolve_grayscale_same(images, kernel):
-    """Performs a same convolution on grayscale images"""
+def convolve_grayscale_same(images, kernel, dtype=float,
+                            accumulate_dtype=None):
+    """
+    Performs a same convolution on grayscale images
+
+    Args:
+        images (np.ndarray): shape (m, h, w) multiple grayscale images.
+        kernel (np.ndarray): shape (kh, kw), the convolution kernel.
+        dtype: dtype of the output, float64 by default.
+        accumulate_dtype: dtype the sums are computed in, by default
+            dtype itself (float64 for non-float dtypes).
+
+    Returns:
+        np.ndarray: the convolved images with shape (m, h, w).
+    """
     m, h, w = images.shape
     kh, kw = kernel.shape
+    images, kernel = conv_engine.cast_inputs(
+        images, kernel, dtype, accumulate_dtype
+    )
 
     # Calculate padding
     pad_h = kh // 2
     pad_w = kw // 2
 
-    # Pad the images with 0s
-    padded_images = np.pad(
-        images,
-        pad_width=((0, 0), (pad_h, pad_h), (pad_w, pad_w)),
-        mode='constant',
-        constant_values=0
-    )
-
-    # Prepare the output
-    output = np.zeros((m, h, w))
+    # Pad the images with 0s, keeping only what an (h, w) output reads
+    padded_images = conv_engine.pad_images(
+        images[..., np.newaxis], pad_h, pad_w
+    )[:, :h + kh - 1, :w + kw - 1]
 
-    # Perform convolution using only 2 loops
-    for i in range(h):
-        for j in range(w):
-            # Extract the current region for all m images
-            region = padded_images[:, i:i + kh, j:j + kw]
-            # Perform element-wise multiplication and sum
-            output[:, i, j] = np.sum(region * kernel, axis=(1, 2))
+    output = conv_engine.convolve_padded(
+        padded_images, kernel[:, :, np.newaxis, np.newaxis], (1, 1)
+    )
 
-    return output
+    return conv_engine.to_dtype(output[..., 0], dtype)
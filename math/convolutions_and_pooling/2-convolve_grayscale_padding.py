@@ -2,9 +2,11 @@
 """Performs a valid convolution on grayscale images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def convolve_grayscale_padding(images, kernel, padding):
+def convolve_grayscale_padding(images, kernel, padding, dtype=float,
+                               accumulate_dtype=None):
     """
     Performs a convolution on grayscale images with custom padding.
 
@@ -12,32 +14,23 @@ def convolve_grayscale_padding(images, kernel, padding):
         images (np.ndarray): shape (m, h, w), grayscale images
         kernel (np.ndarray): shape (kh, kw), convolution kernel
         padding (tuple): (ph, pw), padding for height and width
+        dtype: dtype of the output, float64 by default.
+        accumulate_dtype: dtype the sums are computed in, by default
+            dtype itself (float64 for non-float dtypes).
 
     Returns:
         np.ndarray: convolved images
     """
-    m, h, w = images.shape
-    kh, kw = kernel.shape
     ph, pw = padding
+    images, kernel = conv_engine.cast_inputs(
+        images, kernel, dtype, accumulate_dtype
+    )
 
     # Pad images with zeros
-    padded_images = np.pad(
-        images, ((0, 0), (ph, ph), (pw, pw)), mode='constant'
-        )
-
-    # Compute output dimensions
-    output_h = h + 2 * ph - kh + 1
-    output_w = w + 2 * pw - kw + 1
-
-    # Initialize output
-    output = np.zeros((m, output_h, output_w))
-
-    # Perform convolution
-    for i in range(output_h):
-        for j in range(output_w):
-            output[:, i, j] = np.sum(
-                padded_images[:, i:i+kh, j:j+kw] * kernel,
-                axis=(1, 2)
-            )
-
-    return output
+    padded_images = conv_engine.pad_images(images[..., np.newaxis], ph, pw)
+
+    output = conv_engine.convolve_padded(
+        padded_images, kernel[:, :, np.newaxis, np.newaxis], (1, 1)
+    )
+
+    return conv_engine.to_dtype(output[..., 0], dtype)
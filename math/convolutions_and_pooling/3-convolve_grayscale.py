@@ -2,9 +2,11 @@
 """Performs a valid convolution on grayscale images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def convolve_grayscale(images, kernel, padding='same', stride=(1, 1)):
+def convolve_grayscale(images, kernel, padding='same', stride=(1, 1),
+                       dtype=float, accumulate_dtype=None):
     """
     Performs convolution on grayscale images with optional padding and stride.
 
@@ -13,6 +15,9 @@ def convolve_grayscale(images, kernel, padding='same', stride=(1, 1)):
         kernel (np.ndarray): shape (kh, kw), convolution kernel
         padding (str or tuple): 'same', 'valid', or (ph, pw)
         stride (tuple): (sh, sw), strides for height and width
+        dtype: dtype of the output, float64 by default.
+        accumulate_dtype: dtype the sums are computed in, by default
+            dtype itself (float64 for non-float dtypes).
 
     Returns:
         np.ndarray: convolved images
@@ -25,29 +30,26 @@ def convolve_grayscale(images, kernel, padding='same', stride=(1, 1)):
     if type(padding) == tuple:
         ph, pw = padding
     elif padding == 'same':
-        ph = ((h - 1) * sh + kh - h) // 2 + ((h - 1) * sh + kh - h) % 2
-        pw = ((w - 1) * sw + kw - w) // 2 + ((w - 1) * sw + kw - w) % 2
+        ph, pw = conv_engine.same_padding(h, w, kh, kw, sh, sw)
     else:  # 'valid'
         ph, pw = 0, 0
 
+    images, kernel = conv_engine.cast_inputs(
+        images, kernel, dtype, accumulate_dtype
+    )
+
     # Pad images
-    images_padded = np.pad(
-        images, ((0, 0), (ph, ph), (pw, pw)), mode='constant'
-        )
-
-    # Compute output dimensions
-    out_h = (h + 2 * ph - kh) // sh + 1
-    out_w = (w + 2 * pw - kw) // sw + 1
-
-    # Initialize output
-    output = np.zeros((m, out_h, out_w))
-
-    # Perform convolution
-    for i in range(out_h):
-        for j in range(out_w):
-            h_start = i * sh
-            w_start = j * sw
-            region = images_padded[:, h_start:h_start+kh, w_start:w_start+kw]
-            output[:, i, j] = np.sum(region * kernel, axis=(1, 2))
-
-    return output
+    images_padded = conv_engine.pad_images(images[..., np.newaxis], ph, pw)
+
+    # Rank-1 kernels (Gaussian, Sobel, ...) run as two 1D passes
+    factors = conv_engine.separable_factors(kernel[:, :, np.newaxis])
+    if factors is not None:
+        u, v = factors
+        output = conv_engine.convolve_separable(images_padded, u, v, stride)
+        return conv_engine.to_dtype(output, dtype)
+
+    output = conv_engine.convolve_padded(
+        images_padded, kernel[:, :, np.newaxis, np.newaxis], stride
+    )
+
+    return conv_engine.to_dtype(output[..., 0], dtype)
@@ -2,9 +2,11 @@
 """Performs a valid convolution on grayscale images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def convolve_channels(images, kernel, padding='same', stride=(1, 1)):
+def convolve_channels(images, kernel, padding='same', stride=(1, 1),
+                      dtype=float, accumulate_dtype=None):
     """
     Performs a convolution on images with channels using a single kernel.
 
@@ -13,6 +15,9 @@ def convolve_channels(images, kernel, padding='same', stride=(1, 1)):
         kernel (np.ndarray): shape (kh, kw, c)
         padding (str or tuple): 'same', 'valid', or (ph, pw)
         stride (tuple): (sh, sw)
+        dtype: dtype of the output, float64 by default.
+        accumulate_dtype: dtype the sums are computed in, by default
+            dtype itself (float64 for non-float dtypes).
 
     Returns:
         np.ndarray: convolved images
@@ -24,26 +29,24 @@ def convolve_channels(images, kernel, padding='same', stride=(1, 1)):
     if type(padding) == tuple:
         ph, pw = padding
     elif padding == 'same':
-        ph = ((h - 1) * sh + kh - h) // 2 + ((h - 1) * sh + kh - h) % 2
-        pw = ((w - 1) * sw + kw - w) // 2 + ((w - 1) * sw + kw - w) % 2
+        ph, pw = conv_engine.same_padding(h, w, kh, kw, sh, sw)
     else:  # 'valid'
         ph = pw = 0
 
-    padded_images = np.pad(
-        images,
-        ((0, 0), (ph, ph), (pw, pw), (0, 0)),
-        mode='constant'
+    images, kernel = conv_engine.cast_inputs(
+        images, kernel, dtype, accumulate_dtype
     )
+    padded_images = conv_engine.pad_images(images, ph, pw)
 
-    out_h = (h + 2 * ph - kh) // sh + 1
-    out_w = (w + 2 * pw - kw) // sw + 1
-    output = np.zeros((m, out_h, out_w))
+    # Rank-1 kernels (Gaussian, Sobel, ...) run as two 1D passes
+    factors = conv_engine.separable_factors(kernel)
+    if factors is not None:
+        u, v = factors
+        output = conv_engine.convolve_separable(padded_images, u, v, stride)
+        return conv_engine.to_dtype(output, dtype)
 
-    for i in range(out_h):
-        for j in range(out_w):
-            hs = i * sh
-            ws = j * sw
-            region = padded_images[:, hs:hs + kh, ws:ws + kw, :]
-            output[:, i, j] = np.sum(region * kernel, axis=(1, 2, 3))
+    output = conv_engine.convolve_padded(
+        padded_images, kernel[..., np.newaxis], stride
+    )
 
-    return output
+    return conv_engine.to_dtype(output[..., 0], dtype)
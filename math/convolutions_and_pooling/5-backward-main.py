@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import numpy as np
+convolve = __import__('5-convolve').convolve
+convolve_backward = __import__('5-convolve').convolve_backward
+
+# Largest error allowed relative to the largest gradient magnitude
+TOLERANCE = 1e-6
+STEP = 1e-6
+
+
+def numeric_gradient(loss, x):
+    """Central differences of loss() with respect to every entry of x."""
+    grad = np.zeros(x.shape)
+    for i in np.ndindex(x.shape):
+        saved = x[i]
+        x[i] = saved + STEP
+        up = loss()
+        x[i] = saved - STEP
+        down = loss()
+        x[i] = saved
+        grad[i] = (up - down) / (2 * STEP)
+    return grad
+
+
+def close(analytic, numeric):
+    """Compares two gradients within TOLERANCE."""
+    scale = max(np.max(np.abs(numeric)), 1.)
+    return bool(analytic.shape == numeric.shape and
+                np.max(np.abs(analytic - numeric)) <= TOLERANCE * scale)
+
+
+def check(images, kernels, padding, stride, cached):
+    """Checks dX, dK and db of one forward configuration."""
+    bias = np.zeros((1, 1, 1, kernels.shape[3]))
+    cache = {} if cached else None
+    out = convolve(images, kernels, padding=padding, stride=stride,
+                   method='direct', cache=cache)
+    weights = np.random.default_rng(1).normal(size=out.shape)
+
+    def loss():
+        """Weighted sum of the biased outputs, so dZ = weights."""
+        return np.sum(weights * (convolve(
+            images, kernels, padding=padding, stride=stride,
+            method='direct') + bias))
+
+    dX, dK, db = convolve_backward(weights, images, kernels, padding=padding,
+                                   stride=stride, cache=cache)
+    return [close(dX, numeric_gradient(loss, images)),
+            close(dK, numeric_gradient(loss, kernels)),
+            close(db, numeric_gradient(loss, bias))]
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    images = rng.normal(size=(2, 7, 6, 2))
+    kernels = rng.normal(size=(3, 2, 2, 3))
+    for padding in ('same', 'valid', (2, 1)):
+        for stride in ((1, 1), (2, 3)):
+            for cached in (False, True):
+                print(padding, stride, 'cached' if cached else 'uncached',
+                      check(images, kernels, padding, stride, cached))
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Measures how convolve scales with the number of threads."""
+
+import os
+import time
+
+import numpy as np
+convolve = __import__('5-convolve').convolve
+
+
+def timed(func, *args, **kwargs):
+    """Returns the best wall time in seconds of three calls."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    np.random.seed(0)
+    images = np.random.rand(512, 64, 64, 3)
+    kernels = np.random.rand(5, 5, 3, 32)
+    cores = os.cpu_count() or 1
+
+    base = timed(convolve, images, kernels, method='direct', n_jobs=1)
+    print("{:>6} {:>10} {:>8}".format("n_jobs", "seconds", "speedup"))
+    for n_jobs in range(1, cores + 1):
+        t = timed(convolve, images, kernels, method='direct', n_jobs=n_jobs)
+        print("{:>6} {:>10.4f} {:>8.2f}".format(n_jobs, t, base / t))
@@ -2,9 +2,11 @@
 """Performs a valid convolution on grayscale images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def convolve(images, kernels, padding='same', stride=(1, 1)):
+def convolve(images, kernels, padding='same', stride=(1, 1), method='auto',
+             n_jobs=None, cache=None, dtype=float, accumulate_dtype=None):
     """
     Performs a convolution on images using multiple kernels.
 
@@ -13,12 +15,24 @@ def convolve(images, kernels, padding='same', stride=(1, 1)):
         kernels: Array with shape (kh, kw, c, nc) containing the kernels.
         padding (str or tuple): 'same', 'valid', or a tuple (ph, pw).
         stride (tuple): Tuple (sh, sw) for vertical and horizontal stride.
+        method (str): 'direct' for the windowed contraction, 'fft' for
+            real FFTs over the padded plane, 'winograd' for Winograd
+            F(2x2, 3x3) (3x3 kernels at stride (1, 1) only), or 'auto' to
+            pick the cheapest one from the kernel and image sizes.
+        n_jobs (int): Number of threads sharing the work across blocks of
+            images (or kernels), -1 for one per CPU. Defaults to 1.
+        cache (dict): Optional dict that receives the padding and the
+            windowed view of the padded images for `convolve_backward`.
+        dtype: dtype of the output, float64 by default.
+        accumulate_dtype: dtype the sums are computed in, by default
+            dtype itself (float64 for non-float dtypes).
 
     Returns:
         np.ndarray: Convolved output with shape (m, oh, ow, nc).
 
     Raises:
-        ValueError: If number of channels in images and kernels do not match.
+        ValueError: If number of channels in images and kernels do not match,
+            or if method is unknown.
     """
     m, h, w, c = images.shape
     kh, kw, kc, nc = kernels.shape
@@ -28,43 +42,79 @@ def convolve(images, kernels, padding='same', stride=(1, 1)):
         raise ValueError(
             "The number of channels in the image and kernel must match."
             )
+    if method not in ('auto', 'direct', 'fft', 'winograd'):
+        raise ValueError(
+            "method must be 'auto', 'direct', 'fft' or 'winograd'"
+            )
+    if method == 'winograd' and (kh, kw, sh, sw) != (3, 3, 1, 1):
+        raise ValueError(
+            "method 'winograd' requires a 3x3 kernel and stride (1, 1)"
+            )
 
     # Calculate padding
-    if padding == 'same':
-        ph = int(
-            ((h - 1) * sh + kh - h) / 2) + (
-                1 if ((h - 1) * sh + kh - h) % 2 else 0
-                )
-        pw = int(
-            ((w - 1) * sw + kw - w) / 2) + (
-                1 if ((w - 1) * sw + kw - w) % 2 else 0
-                )
-    elif padding == 'valid':
-        ph, pw = 0, 0
-    else:
-        ph, pw = padding
+    ph, pw = conv_engine.resolve_padding(padding, h, w, kh, kw, sh, sw)
 
     # Apply padding
-    padded = np.pad(
-        images,
-        ((0, 0), (ph, ph), (pw, pw), (0, 0)),
-        mode='constant'
+    images, kernels = conv_engine.cast_inputs(
+        images, kernels, dtype, accumulate_dtype
     )
+    padded = conv_engine.pad_images(images, ph, pw)
+    if cache is not None:
+        cache['padding'] = (ph, pw)
+        cache['windows'] = conv_engine.window_view(padded, kh, kw, sh, sw)
+
+    if method == 'auto':
+        method = conv_engine.choose_method(padded.shape, kernels.shape, stride)
+    if method == 'fft':
+        engine = conv_engine.convolve_padded_fft
+    elif method == 'winograd':
+        engine = conv_engine.winograd_engine
+    else:
+        engine = conv_engine.convolve_padded
+    output = conv_engine.convolve_parallel(
+        padded, kernels, stride, engine, n_jobs
+    )
+    return conv_engine.to_dtype(output, dtype)
+
+
+def convolve_backward(dZ, images, kernels, padding='same', stride=(1, 1),
+                      cache=None):
+    """
+    Backpropagates through `convolve`.
 
-    # Calculate output dimensions
-    oh = (padded.shape[1] - kh) // sh + 1
-    ow = (padded.shape[2] - kw) // sw + 1
+    Parameters:
+        dZ: Array with shape (m, oh, ow, nc), gradient of the output.
+        images: Array with shape (m, h, w, c) given to the forward pass.
+        kernels: Array with shape (kh, kw, c, nc) given to the forward pass.
+        padding (str or tuple): 'same', 'valid', or a tuple (ph, pw).
+        stride (tuple): Tuple (sh, sw) for vertical and horizontal stride.
+        cache (dict): The cache filled by the forward `convolve` call; its
+            windowed view is reused instead of padding the images again.
 
-    # Initialize output
-    output = np.zeros((m, oh, ow, nc))
+    Returns:
+        tuple: (dX, dK, db) with shapes (m, h, w, c), (kh, kw, c, nc) and
+        (1, 1, 1, nc).
+    """
+    m, h, w, c = images.shape
+    kh, kw, _, nc = kernels.shape
+    sh, sw = stride
+
+    if cache is not None and 'windows' in cache:
+        ph, pw = cache['padding']
+        windows = cache['windows']
+    else:
+        ph, pw = conv_engine.resolve_padding(padding, h, w, kh, kw, sh, sw)
+        padded = conv_engine.pad_images(images, ph, pw)
+        windows = conv_engine.window_view(padded, kh, kw, sh, sw)
 
-    # Perform convolution
-    for i in range(oh):
-        for j in range(ow):
-            img_slice = padded[:, i * sh:i * sh + kh, j * sw:j * sw + kw, :]
-            for k in range(nc):
-                output[:, i, j, k] = np.sum(
-                    img_slice * kernels[:, :, :, k], axis=(1, 2, 3)
-                    )
+    db = np.sum(dZ, axis=(0, 1, 2), keepdims=True)
+    dK = np.tensordot(windows, dZ, axes=([0, 1, 2], [0, 1, 2]))
+
+    # col2im: every window receives dZ . K and is added back in place
+    dwindows = np.tensordot(dZ, kernels, axes=([3], [3]))
+    dpadded = conv_engine.scatter_windows(
+        dwindows, (m, h + 2 * ph, w + 2 * pw, c), stride
+    )
+    dX = dpadded[:, ph:ph + h, pw:pw + w]
 
-    return output
+    return dX, dK, db
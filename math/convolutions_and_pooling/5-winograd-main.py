@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+import numpy as np
+convolve = __import__('5-convolve').convolve
+
+# Largest error allowed relative to the largest output magnitude
+TOLERANCE = {np.float64: 1e-12, np.float32: 1e-5}
+
+
+def agrees(images, kernels, padding, dtype):
+    """Compares the winograd and direct methods within TOLERANCE."""
+    direct = convolve(images, kernels, padding=padding, method='direct',
+                      dtype=dtype)
+    winograd = convolve(images, kernels, padding=padding, method='winograd',
+                        dtype=dtype)
+    scale = max(np.max(np.abs(direct)), 1.)
+    return bool(winograd.shape == direct.shape and
+                winograd.dtype == direct.dtype and
+                np.max(np.abs(winograd - direct)) <= TOLERANCE[dtype] * scale)
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    kernels = rng.normal(size=(3, 3, 3, 4))
+    for h, w in ((8, 8), (7, 9), (5, 6)):
+        images = rng.uniform(0, 255, size=(2, h, w, 3))
+        for dtype in (np.float64, np.float32):
+            print(h, w, dtype.__name__, [
+                agrees(images.astype(dtype), kernels, padding, dtype)
+                for padding in ('same', 'valid', (1, 2), (0, 3))])
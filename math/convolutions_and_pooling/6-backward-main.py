@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+import numpy as np
+pool = __import__('6-pool').pool
+pool_backward = __import__('6-pool').pool_backward
+numeric_gradient = __import__('5-backward-main').numeric_gradient
+close = __import__('5-backward-main').close
+
+
+def check(images, kernel_shape, stride, mode, cached):
+    """Checks dX of one forward configuration."""
+    indices = None
+    if cached:
+        out, indices = pool(images, kernel_shape, stride, mode,
+                            return_indices=True)
+    else:
+        out = pool(images, kernel_shape, stride, mode)
+    weights = np.random.default_rng(1).normal(size=out.shape)
+
+    def loss():
+        """Weighted sum of the pooled outputs, so dA = weights."""
+        return np.sum(weights * pool(images, kernel_shape, stride, mode))
+
+    dX = pool_backward(weights, images, kernel_shape, stride, mode,
+                       indices=indices)
+    return close(dX, numeric_gradient(loss, images))
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    images = rng.normal(size=(2, 7, 6, 2))
+    for kernel_shape, stride in (((2, 2), (2, 2)), ((3, 2), (2, 3)),
+                                 ((2, 3), (1, 1))):
+        print(kernel_shape, stride, [
+            check(images, kernel_shape, stride, 'avg', False),
+            check(images, kernel_shape, stride, 'max', False),
+            check(images, kernel_shape, stride, 'max', True)])
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
-"""Performs a valid convolution on grayscale images."""
+"""Performs pooling on images."""
 
 import numpy as np
+conv_engine = __import__('conv_engine')
 
 
-def pool(images, kernel_shape, stride, mode='max'):
+def pool(images, kernel_shape, stride, mode='max', return_indices=False,
+         dtype=float, accumulate_dtype=None):
     """
     Performs pooling on images
 
@@ -13,9 +15,17 @@ def pool(images, kernel_shape, stride, mode='max'):
         kernel_shape: tuple (kh, kw) - kernel shape
         stride: tuple (sh, sw) - strides
         mode: str - either 'max' or 'avg'
+        return_indices: bool - also return the argmax of every window as
+            a flat index r * w + col into the (h, w) plane, for
+            max-unpooling and backpropagation (max mode only)
+        dtype: dtype of the output, float64 by default; max pooling
+            works in the input dtype, so uint8 images can stay uint8
+        accumulate_dtype: dtype the averages are computed in, by default
+            dtype itself (float64 for non-float dtypes)
 
     Returns:
-        numpy.ndarray containing the pooled images
+        numpy.ndarray containing the pooled images, and if return_indices
+        is True a numpy.ndarray (m, oh, ow, c) of the argmax indices
     """
     m, h, w, c = images.shape
     kh, kw = kernel_shape
@@ -24,14 +34,75 @@ def pool(images, kernel_shape, stride, mode='max'):
     oh = (h - kh) // sh + 1
     ow = (w - kw) // sw + 1
 
-    pooled = np.zeros((m, oh, ow, c))
+    if return_indices and mode != 'max':
+        raise ValueError("return_indices requires mode='max'")
 
-    for i in range(oh):
-        for j in range(ow):
-            img_slice = images[:, i * sh:i * sh + kh, j * sw:j * sw + kw, :]
-            if mode == 'max':
-                pooled[:, i, j, :] = np.max(img_slice, axis=(1, 2))
-            elif mode == 'avg':
-                pooled[:, i, j, :] = np.mean(img_slice, axis=(1, 2))
+    if mode not in ('max', 'avg'):
+        return np.zeros((m, oh, ow, c), dtype=dtype)
 
-    return pooled
+    acc = conv_engine.accumulate_type(dtype, accumulate_dtype)
+
+    def reduce(x, axis):
+        """Reduces the windows of x over axis."""
+        if mode == 'max':
+            return np.max(x, axis=axis)
+        return np.mean(x, axis=axis, dtype=acc)
+
+    if return_indices:
+        windows = conv_engine.window_view(images, kh, kw, sh, sw)
+        flat = windows.reshape((m, oh, ow, kh * kw, c))
+        k = np.argmax(flat, axis=3)
+        pooled = np.take_along_axis(flat, k[:, :, :, np.newaxis], axis=3)
+        rows = np.arange(oh)[:, np.newaxis, np.newaxis] * sh + k // kw
+        cols = np.arange(ow)[:, np.newaxis] * sw + k % kw
+        pooled = conv_engine.to_dtype(pooled[:, :, :, 0], dtype)
+        return pooled, rows * w + cols
+
+    if (sh, sw) == (kh, kw) and h % kh == 0 and w % kw == 0:
+        # Non-overlapping tiles that cover the image: a plain reshape
+        tiles = images.reshape((m, oh, kh, ow, kw, c))
+        return conv_engine.to_dtype(reduce(tiles, axis=(2, 4)), dtype)
+
+    windows = conv_engine.window_view(images, kh, kw, sh, sw)
+    return conv_engine.to_dtype(reduce(windows, axis=(3, 4)), dtype)
+
+
+def pool_backward(dA, images, kernel_shape, stride, mode='max',
+                  indices=None):
+    """
+    Backpropagates through `pool`
+
+    Args:
+        dA: numpy.ndarray (m, oh, ow, c), gradient of the pooled output
+        images: numpy.ndarray (m, h, w, c) given to the forward pass
+        kernel_shape: tuple (kh, kw) - kernel shape
+        stride: tuple (sh, sw) - strides
+        mode: str - either 'max' or 'avg'
+        indices: numpy.ndarray (m, oh, ow, c) argmax indices returned by
+            pool(..., return_indices=True); computed if not given
+
+    Returns:
+        numpy.ndarray (m, h, w, c), the gradient of the images
+    """
+    m, h, w, c = images.shape
+    kh, kw = kernel_shape
+
+    if mode == 'avg':
+        # Every tap of a window receives an equal share of its gradient
+        share = dA / (kh * kw)
+        dwindows = np.broadcast_to(
+            share[:, :, :, np.newaxis, np.newaxis],
+            share.shape[:3] + (kh, kw, c)
+        )
+        return conv_engine.scatter_windows(dwindows, images.shape, stride)
+
+    if indices is None:
+        _, indices = pool(images, kernel_shape, stride, mode='max',
+                          return_indices=True)
+
+    # The maximum of each window receives its whole gradient
+    dX = np.zeros((m, h * w, c))
+    samples = np.arange(m)[:, np.newaxis, np.newaxis, np.newaxis]
+    channels = np.arange(c)
+    np.add.at(dX, (samples, indices, channels), dA)
+    return dX.reshape((m, h, w, c))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+
+import numpy as np
+convolve = __import__('5-convolve').convolve
+pool = __import__('6-pool').pool
+streaming = __import__('streaming')
+
+
+def uneven_chunks(images, sizes):
+    """Yields consecutive chunks of images of the given sizes."""
+    start = 0
+    for size in sizes:
+        yield images[start:start + size]
+        start += size
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    images = rng.uniform(0, 255, size=(23, 9, 8, 3))
+    kernels = rng.normal(size=(3, 3, 3, 4))
+    sizes = (5, 1, 10, 7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = np.lib.format.open_memmap(
+            os.path.join(tmp, 'images.npy'), mode='w+',
+            dtype=images.dtype, shape=images.shape)
+        source[...] = images
+        source.flush()
+
+        for padding, stride in (('same', (1, 1)), ('valid', (2, 1)),
+                                ((1, 2), (2, 3))):
+            whole = convolve(images, kernels, padding=padding, stride=stride)
+            out = np.lib.format.open_memmap(
+                os.path.join(tmp, 'conv.npy'), mode='w+',
+                dtype=whole.dtype, shape=whole.shape)
+            streamed = streaming.convolve_stream(
+                source, kernels, out, padding=padding, stride=stride,
+                chunk_size=6)
+            chunked = streaming.convolve_stream(
+                uneven_chunks(images, sizes), kernels,
+                np.empty(whole.shape), padding=padding, stride=stride)
+            print(padding, stride, np.allclose(streamed, whole),
+                  np.allclose(chunked, whole))
+            del out, streamed
+
+        for mode in ('max', 'avg'):
+            whole = pool(images, (2, 3), (2, 2), mode)
+            out = np.lib.format.open_memmap(
+                os.path.join(tmp, 'pool.npy'), mode='w+',
+                dtype=whole.dtype, shape=whole.shape)
+            streamed = streaming.pool_stream(source, (2, 3), (2, 2), out,
+                                             mode, chunk_size=6)
+            chunked = streaming.pool_stream(
+                uneven_chunks(images, sizes), (2, 3), (2, 2),
+                np.empty(whole.shape), mode)
+            print(mode, np.array_equal(streamed, whole),
+                  np.array_equal(chunked, whole))
+            del out, streamed
+        del source
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Streams convolution and pooling over batches larger than memory."""
+
+import numpy as np
+conv_engine = __import__('conv_engine')
+pool = __import__('6-pool').pool
+
+
+def iter_chunks(images, chunk_size):
+    """
+    Yields the image batch chunk by chunk.
+
+    Args:
+        images: numpy.ndarray or numpy.memmap (m, h, w, c), sliced along m,
+            or any iterable of (k, h, w, c) chunks
+        chunk_size: int - images per chunk when slicing an array
+
+    Yields:
+        numpy.ndarray chunks of shape (k, h, w, c)
+    """
+    if isinstance(images, np.ndarray):
+        for start in range(0, images.shape[0], chunk_size):
+            yield images[start:start + chunk_size]
+    else:
+        for chunk in images:
+            yield np.asarray(chunk)
+
+
+def convolve_stream(images, kernels, out, padding='same', stride=(1, 1),
+                    chunk_size=256):
+    """
+    Performs a convolution on a stream of image chunks.
+
+    Each chunk is padded on the fly (the zero padding is never
+    materialized) and its result is written into the matching slice of
+    out, so peak memory is bounded by one chunk and its output.
+
+    Args:
+        images: numpy.memmap / numpy.ndarray (m, h, w, c) or an iterable of
+            (k, h, w, c) chunks
+        kernels: numpy.ndarray (kh, kw, c, nc) containing the kernels
+        out: numpy.memmap / numpy.ndarray (m, oh, ow, nc) supplied by the
+            caller, e.g. np.lib.format.open_memmap(..., mode='w+')
+        padding: 'same', 'valid', or a tuple (ph, pw)
+        stride: tuple (sh, sw)
+        chunk_size: int - images per chunk when images is an array
+
+    Returns:
+        out, filled with the convolved images
+    """
+    kh, kw, kc, nc = kernels.shape
+    sh, sw = stride
+    start = 0
+    buffer = None
+
+    for chunk in iter_chunks(images, chunk_size):
+        k, h, w, c = chunk.shape
+        if c != kc:
+            raise ValueError(
+                "The number of channels in the image and kernel must match."
+            )
+        ph, pw = conv_engine.resolve_padding(padding, h, w, kh, kw, sh, sw)
+
+        oh = (h + 2 * ph - kh) // sh + 1
+        ow = (w + 2 * pw - kw) // sw + 1
+        if buffer is None or buffer.shape[0] < k:
+            buffer = np.empty((k, oh, ow, nc))
+        result = conv_engine.convolve_shifted(
+            chunk, kernels, (ph, pw), stride, out=buffer[:k]
+        )
+        out[start:start + k] = result
+        start += k
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def pool_stream(images, kernel_shape, stride, out, mode='max',
+                chunk_size=256):
+    """
+    Performs pooling on a stream of image chunks.
+
+    Args:
+        images: numpy.memmap / numpy.ndarray (m, h, w, c) or an iterable of
+            (k, h, w, c) chunks
+        kernel_shape: tuple (kh, kw) - kernel shape
+        stride: tuple (sh, sw) - strides
+        out: numpy.memmap / numpy.ndarray (m, oh, ow, c) supplied by the
+            caller
+        mode: str - either 'max' or 'avg'
+        chunk_size: int - images per chunk when images is an array
+
+    Returns:
+        out, filled with the pooled images
+    """
+    start = 0
+    for chunk in iter_chunks(images, chunk_size):
+        k = chunk.shape[0]
+        out[start:start + k] = pool(chunk, kernel_shape, stride, mode)
+        start += k
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+This module provides a function to add two N-dimensional matrices.
+"""
+from operator import add
+
+flatten = __import__('matrix').flatten
+unflatten = __import__('matrix').unflatten
+
+
+def add_matrices(mat1, mat2):
+    """
+    Adds two N-dimensional matrices element-wise.
+
+    Both matrices are validated and flattened level by level, summed in a
+    single pass over the flat buffers and nested back once.
+
+    Args:
+        mat1 (list): The first rectangular nested list of int/float.
+        mat2 (list): The second rectangular nested list of int/float.
+
+    Returns:
+        list: A new matrix containing the element-wise sums, or None if
+        the matrices are not rectangular or not the same shape.
+    """
+    try:
+        shape1, flat1 = flatten(mat1)
+        shape2, flat2 = flatten(mat2)
+    except ValueError:
+        return None
+    if shape1 != shape2:
+        return None
+    return unflatten(list(map(add, flat1, flat2)), shape1)
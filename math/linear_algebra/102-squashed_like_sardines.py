@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+This module provides a function to concatenate two N-dimensional matrices
+along a specific axis.
+"""
+flatten = __import__('matrix').flatten
+unflatten = __import__('matrix').unflatten
+
+
+def cat_matrices(mat1, mat2, axis=0):
+    """
+    Concatenates two N-dimensional matrices along a specific axis.
+
+    In row-major order each matrix is a sequence of contiguous blocks,
+    one per index of the axes before `axis`, so the result is built by
+    interleaving those blocks in one pass and nesting it back once.
+
+    Args:
+        mat1 (list): The first rectangular nested list of int/float.
+        mat2 (list): The second rectangular nested list of int/float.
+        axis (int): The axis along which to concatenate.
+
+    Returns:
+        list: A new matrix after concatenation, or None if the matrices
+        cannot be concatenated.
+    """
+    try:
+        shape1, flat1 = flatten(mat1)
+        shape2, flat2 = flatten(mat2)
+    except ValueError:
+        return None
+    if (
+        len(shape1) != len(shape2) or
+        not 0 <= axis < len(shape1) or
+        shape1[:axis] != shape2[:axis] or
+        shape1[axis + 1:] != shape2[axis + 1:]
+    ):
+        return None
+
+    outer = 1
+    for dim in shape1[:axis]:
+        outer *= dim
+    if axis == 0 or not outer:
+        flat = flat1 + flat2
+    else:
+        block1 = len(flat1) // outer
+        block2 = len(flat2) // outer
+        flat = []
+        for i in range(outer):
+            flat.extend(flat1[i * block1:(i + 1) * block1])
+            flat.extend(flat2[i * block2:(i + 1) * block2])
+    shape = list(shape1)
+    shape[axis] += shape2[axis]
+    return unflatten(flat, shape)
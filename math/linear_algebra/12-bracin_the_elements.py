@@ -2,10 +2,190 @@
 """
 This module provides a function to perform element-wise addition,
 subtraction, multiplication, and division of numpy arrays.
+
+Besides the eager tuple, results can be computed lazily (each field on
+first access) or written into caller-provided buffers. Whenever several
+results are computed together they share one blocked pass over the
+inputs, so each input block is read once while it is still in cache.
 """
+import numpy as np
+
+FIELDS = ('sum', 'difference', 'product', 'quotient')
+UFUNCS = {
+    'sum': np.add,
+    'difference': np.subtract,
+    'product': np.multiply,
+    'quotient': np.true_divide,
+}
+BLOCK = 1 << 16
+
+
+def same_layout(x, y):
+    """
+    Tells whether two arrays view exactly the same elements in the same
+    order.
+
+    Args:
+        x (numpy.ndarray): The first array.
+        y (numpy.ndarray): The second array.
+
+    Returns:
+        bool: True if x and y share data pointer, shape and strides.
+    """
+    return (x.shape == y.shape and x.strides == y.strides and
+            x.__array_interface__['data'][0] ==
+            y.__array_interface__['data'][0])
+
+
+def fused(mat1, mat2, names, out=None):
+    """
+    Computes several element-wise results in one blocked pass.
+
+    The broadcast output is processed in blocks of about BLOCK elements
+    along its first axis, and every requested ufunc runs on a block
+    before moving on to the next one. An out buffer may be one of the
+    inputs: each block of that input is copied before it is overwritten,
+    or, if the buffer overlaps the input in any other way, the whole
+    input is copied first.
+
+    Args:
+        mat1: numpy.ndarray or compatible
+        mat2: numpy.ndarray or compatible
+        names (iterable of str): The fields of FIELDS to compute.
+        out (dict): Optional buffers by field name to write into.
+
+    Returns:
+        dict: The computed arrays by field name.
+    """
+    names = list(names)
+    out = dict(out or {})
+    operands = [m if np.ndim(m) == 0 else np.asarray(m) for m in (mat1, mat2)]
+    shape = np.broadcast_shapes(*(np.shape(m) for m in operands))
+    # 1-element probes give NumPy's own result types (incl. weak scalars)
+    probe = [m[(slice(0, 1),) * np.ndim(m)] if np.ndim(m) else m
+             for m in operands]
+    for name in names:
+        if out.get(name) is None:
+            dtype = UFUNCS[name](*probe).dtype
+            out[name] = np.empty(shape, dtype=dtype)
+
+    staged = [False, False]
+    for j, m in enumerate(operands):
+        if not isinstance(m, np.ndarray):
+            continue
+        aliased = [out[name] for name in names
+                   if np.shares_memory(out[name], m)]
+        if all(same_layout(buf, m) for buf in aliased):
+            staged[j] = bool(aliased)
+        else:
+            operands[j] = m.copy()
+
+    if not shape:
+        operands = [m.copy() if copy else m
+                    for m, copy in zip(operands, staged)]
+        for name in names:
+            UFUNCS[name](*operands, out=out[name])
+        return out
+
+    views = [np.broadcast_to(m, shape) if np.ndim(m) else m
+             for m in operands]
+    inner = max(1, int(np.prod(shape[1:])))
+    rows = max(1, BLOCK // inner)
+    for start in range(0, shape[0], rows):
+        block = slice(start, start + rows)
+        a, b = (v[block].copy() if copy else v[block] if np.ndim(v) else v
+                for v, copy in zip(views, staged))
+        for name in names:
+            UFUNCS[name](a, b, out=out[name][block])
+    return out
+
+
+class Elementwise:
+    """
+    Lazy (sum, difference, product, quotient) of two arrays.
+
+    Behaves like a namedtuple: fields are available by name, by index
+    and by unpacking. Each field is computed on first access and cached;
+    unpacking computes all missing fields in one fused pass.
+    """
+
+    _fields = FIELDS
+
+    def __init__(self, mat1, mat2):
+        """
+        Initializes the lazy result.
+
+        Args:
+            mat1: numpy.ndarray or compatible
+            mat2: numpy.ndarray or compatible
+        """
+        self.mat1 = mat1
+        self.mat2 = mat2
+        self.cache = {}
+
+    def compute(self, names=FIELDS):
+        """
+        Computes and caches the missing fields among names in one pass.
+
+        Args:
+            names (iterable of str): The fields to compute.
+
+        Returns:
+            tuple: The requested fields in order.
+        """
+        names = tuple(names)
+        missing = [name for name in names if name not in self.cache]
+        if missing:
+            self.cache.update(fused(self.mat1, self.mat2, missing))
+        return tuple(self.cache[name] for name in names)
+
+    @property
+    def sum(self):
+        """The element-wise sum."""
+        return self.compute(('sum',))[0]
+
+    @property
+    def difference(self):
+        """The element-wise difference."""
+        return self.compute(('difference',))[0]
+
+    @property
+    def product(self):
+        """The element-wise product."""
+        return self.compute(('product',))[0]
+
+    @property
+    def quotient(self):
+        """The element-wise quotient."""
+        return self.compute(('quotient',))[0]
+
+    def __len__(self):
+        """Returns the number of fields, 4."""
+        return len(FIELDS)
+
+    def __iter__(self):
+        """Iterates over the fields, computing the missing ones at once."""
+        return iter(self.compute())
+
+    def __getitem__(self, index):
+        """Returns a field, or a tuple of them, by position."""
+        if isinstance(index, slice):
+            return self.compute(FIELDS[index])
+        return self.compute((FIELDS[index],))[0]
+
+    def _asdict(self):
+        """Returns all fields as a dict, computing them if needed."""
+        return dict(zip(FIELDS, self.compute()))
+
+    def __repr__(self):
+        """Shows computed fields and marks the others as pending."""
+        return 'Elementwise({})'.format(', '.join(
+            '{}={}'.format(name, 'pending' if name not in self.cache
+                           else repr(self.cache[name]))
+            for name in FIELDS))
 
 
-def np_elementwise(mat1, mat2):
+def np_elementwise(mat1, mat2, lazy=False, out=None):
     """
     Performs element-wise addition, subtraction, multiplication, and division
     on two numpy arrays.
@@ -13,10 +193,19 @@ def np_elementwise(mat1, mat2):
     Args:
         mat1: numpy.ndarray or compatible
         mat2: numpy.ndarray or compatible
+        lazy (bool): Return an Elementwise whose fields are computed on
+        first access instead of four materialized arrays.
+        out (tuple): Optional (sum, difference, product, quotient) buffers
+        to write into in one fused pass; None entries are allocated.
 
     Returns:
         tuple: (sum, difference, product, quotient) of element-wise operations.
     """
+    if lazy:
+        return Elementwise(mat1, mat2)
+    if out is not None:
+        buffers = fused(mat1, mat2, FIELDS, dict(zip(FIELDS, out)))
+        return tuple(buffers[name] for name in FIELDS)
     return (mat1 + mat2,
             mat1 - mat2,
             mat1 * mat2,
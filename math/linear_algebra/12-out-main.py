@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+
+import numpy as np
+np_elementwise = __import__('12-bracin_the_elements').np_elementwise
+
+mat1 = np.arange(1., 13.).reshape(3, 4)
+mat2 = np.arange(2., 14.).reshape(3, 4)
+expected = np_elementwise(mat1, mat2)
+
+# Sum written back into mat1, difference into mat2
+a, b = mat1.copy(), mat2.copy()
+result = np_elementwise(a, b, out=(a, b, None, None))
+print(result[0] is a, result[1] is b)
+print(all(np.allclose(r, e) for r, e in zip(result, expected)))
+
+# An out buffer overlapping an input at an offset
+buf = np.zeros(13)
+buf[:12] = mat1.ravel()
+a, shifted = buf[:12].reshape(3, 4), buf[1:].reshape(3, 4)
+result = np_elementwise(a, mat2.ravel().reshape(3, 4),
+                        out=(shifted, None, None, None))
+print(all(np.allclose(r, e) for r, e in zip(result, expected)))
+
+# Broadcast scalar input, quotient written back into the array
+a = mat1.copy()
+result = np_elementwise(a, 2., out=(None, None, None, a))
+print(all(np.allclose(r, e) for r, e in zip(
+    result, np_elementwise(mat1, 2.))))
@@ -2,12 +2,15 @@
 """
 This module provides a function to determine the shape of a matrix.
 """
+Matrix = __import__('matrix').Matrix
 
 
 def matrix_shape(matrix):
     """
     Returns the shape of a matrix as a list of dimensions.
     """
+    if isinstance(matrix, Matrix):
+        return list(matrix.shape)
     shape = []
     while isinstance(matrix, list):
         shape.append(len(matrix))
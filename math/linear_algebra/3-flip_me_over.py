@@ -2,10 +2,15 @@
 """
 This module provides a function to transpose a 2D matrix.
 """
+Matrix = __import__('matrix').Matrix
 
 
 def matrix_transpose(matrix):
     """
     Returns the transpose of a 2D matrix.
+
+    A Matrix is transposed as a zero-copy view with swapped strides.
     """
+    if isinstance(matrix, Matrix):
+        return matrix.transpose()
     return [[row[i] for row in matrix] for i in range(len(matrix[0]))]
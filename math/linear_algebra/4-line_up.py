@@ -2,6 +2,11 @@
 """
 This module provides a function to add two vectors element-wise.
 """
+from array import array
+from operator import add
+
+Matrix = __import__('matrix').Matrix
+as_matrix = __import__('matrix').as_matrix
 
 
 def add_arrays(arr1, arr2):
@@ -9,13 +14,32 @@ def add_arrays(arr1, arr2):
     Adds two arrays element-wise.
 
     Args:
-        arr1 (list): The first list of integers/floats.
-        arr2 (list): The second list of integers/floats.
+        arr1 (list or Matrix): The first list of integers/floats.
+        arr2 (list or Matrix): The second list of integers/floats.
 
     Returns:
         list: A new list containing the element-wise sums,
               or None if the arrays are not the same length.
     """
+    if isinstance(arr1, Matrix) or isinstance(arr2, Matrix):
+        return add_flat(as_matrix(arr1), as_matrix(arr2))
     if len(arr1) != len(arr2):
         return None
     return [a + b for a, b in zip(arr1, arr2)]
+
+
+def add_flat(mat1, mat2):
+    """
+    Adds two Matrix objects of the same shape in one pass over their
+    flat buffers.
+
+    Args:
+        mat1 (Matrix): The first matrix.
+        mat2 (Matrix): The second matrix.
+
+    Returns:
+        Matrix: The element-wise sums, or None if the shapes differ.
+    """
+    if mat1.shape != mat2.shape:
+        return None
+    return Matrix(mat1.shape, array('d', map(add, mat1.flat(), mat2.flat())))
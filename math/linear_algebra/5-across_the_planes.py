@@ -2,6 +2,9 @@
 """
 This module provides a function to add two matrices element-wise.
 """
+as_matrix = __import__('matrix').as_matrix
+Matrix = __import__('matrix').Matrix
+add_flat = __import__('4-line_up').add_flat
 
 
 def add_matrices2D(mat1, mat2):
@@ -9,14 +12,16 @@ def add_matrices2D(mat1, mat2):
     Adds two 2D matrices element-wise.
 
     Args:
-        mat1 (list of list of int/float): The first matrix.
-        mat2 (list of list of int/float): The second matrix.
+        mat1 (list of list of int/float or Matrix): The first matrix.
+        mat2 (list of list of int/float or Matrix): The second matrix.
 
     Returns:
         list of list of int/float: A new matrix containing
         the element-wise sums,
         or None if the input matrices are not the same shape.
     """
+    if isinstance(mat1, Matrix) or isinstance(mat2, Matrix):
+        return add_flat(as_matrix(mat1), as_matrix(mat2))
     if len(mat1) != len(mat2) or any(
         len(r1) != len(r2) for r1, r2 in zip(mat1, mat2)
     ):
@@ -2,6 +2,8 @@
 """
 This module provides a function to concatenate two arrays.
 """
+Matrix = __import__('matrix').Matrix
+as_matrix = __import__('matrix').as_matrix
 
 
 def cat_arrays(arr1, arr2):
@@ -9,12 +11,17 @@ def cat_arrays(arr1, arr2):
     Concatenates two arrays (lists) and returns a new list.
 
     Args:
-        arr1 (list of int/float): The first array.
-        arr2 (list of int/float): The second array.
+        arr1 (list of int/float or Matrix): The first array.
+        arr2 (list of int/float or Matrix): The second array.
 
     Returns:
         list of int/float: A new list containing all
         elements of arr1
         followed by all elements of arr2.
     """
+    if isinstance(arr1, Matrix) or isinstance(arr2, Matrix):
+        arr1, arr2 = as_matrix(arr1), as_matrix(arr2)
+        data = arr1.flat()
+        data.extend(arr2.flat())
+        return Matrix((len(data),), data)
     return arr1 + arr2
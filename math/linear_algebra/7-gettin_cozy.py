@@ -3,6 +3,10 @@
 This module provides a function to concatenate two 2D matrices along a
 specific axis.
 """
+from array import array
+
+Matrix = __import__('matrix').Matrix
+as_matrix = __import__('matrix').as_matrix
 
 
 def cat_matrices2D(mat1, mat2, axis=0):
@@ -10,8 +14,8 @@ def cat_matrices2D(mat1, mat2, axis=0):
     Concatenates two 2D matrices along a specific axis.
 
     Args:
-        mat1 (list of list of int/float): The first 2D matrix.
-        mat2 (list of list of int/float): The second 2D matrix.
+        mat1 (list of list of int/float or Matrix): The first 2D matrix.
+        mat2 (list of list of int/float or Matrix): The second 2D matrix.
         axis (int): The axis along which to concatenate (0 for rows,
         1 for columns).
 
@@ -20,6 +24,8 @@ def cat_matrices2D(mat1, mat2, axis=0):
         or
         None if the matrices cannot be concatenated.
     """
+    if isinstance(mat1, Matrix) or isinstance(mat2, Matrix):
+        return cat_flat(as_matrix(mat1), as_matrix(mat2), axis)
     if axis == 0:
         # Check if columns match
         if len(mat1[0]) != len(mat2[0]):
@@ -32,3 +38,36 @@ def cat_matrices2D(mat1, mat2, axis=0):
         return [r1 + r2 for r1, r2 in zip(mat1, mat2)]
     else:
         return None
+
+
+def cat_flat(mat1, mat2, axis=0):
+    """
+    Concatenates two 2D Matrix objects into a new flat buffer.
+
+    Along axis 0 this is a single buffer extend; along axis 1 the rows
+    of both matrices are interleaved one extend per row.
+
+    Args:
+        mat1 (Matrix): The first 2D matrix.
+        mat2 (Matrix): The second 2D matrix.
+        axis (int): The axis along which to concatenate.
+
+    Returns:
+        Matrix: The concatenated matrix, or None if the shapes do not
+        allow it.
+    """
+    if axis == 0:
+        if mat1.cols != mat2.cols:
+            return None
+        data = mat1.flat()
+        data.extend(mat2.flat())
+        return Matrix((mat1.rows + mat2.rows, mat1.cols), data)
+    if axis == 1:
+        if mat1.rows != mat2.rows:
+            return None
+        data = array('d')
+        for i in range(mat1.rows):
+            data.extend(mat1.row(i))
+            data.extend(mat2.row(i))
+        return Matrix((mat1.rows, mat1.cols + mat2.cols), data)
+    return None
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Compares mat_mul with the original i-j-k triple loop."""
+
+import random
+import time
+
+mat_mul = __import__('8-ridin_bareback').mat_mul
+Matrix = __import__('matrix').Matrix
+
+
+def naive_mat_mul(mat1, mat2):
+    """The original i-j-k implementation, indexing mat2 column-wise."""
+    result = []
+    for i in range(len(mat1)):
+        row = []
+        for j in range(len(mat2[0])):
+            s = 0
+            for k in range(len(mat2)):
+                s += mat1[i][k] * mat2[k][j]
+            row.append(s)
+        result.append(row)
+    return result
+
+
+def timed(func, *args):
+    """Returns the best wall time in seconds of three calls."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    print("{:>5} {:>10} {:>10} {:>10}".format(
+        "n", "naive", "lists", "Matrix"))
+    for n in (16, 64, 128, 256):
+        a = [[random.random() for _ in range(n)] for _ in range(n)]
+        b = [[random.random() for _ in range(n)] for _ in range(n)]
+        fa, fb = Matrix.from_lists(a), Matrix.from_lists(b)
+        print("{:>5} {:>10.4f} {:>10.4f} {:>10.4f}".format(
+            n, timed(naive_mat_mul, a, b), timed(mat_mul, a, b),
+            timed(mat_mul, fa, fb)))
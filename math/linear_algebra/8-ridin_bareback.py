@@ -3,32 +3,69 @@
 This module provides a function that performs matrix multiplication
 between two 2D matrices.
 """
+from array import array
+from operator import mul
+
+Matrix = __import__('matrix').Matrix
+as_matrix = __import__('matrix').as_matrix
+
+# Number of mat2 columns kept hot while sweeping the rows of mat1
+TILE = 64
 
 
 def mat_mul(mat1, mat2):
     """
     Multiplies two 2D matrices.
 
+    mat2 is transposed once so that every entry of the result is a
+    row-by-row dot product, computed in C by sum(map(mul, ...)) instead
+    of indexing mat2 column-wise. Large products are tiled over the
+    columns of mat2 so a block of them is reused across all rows of mat1.
+
     Args:
-        mat1 (list of list of int/float): The first matrix.
-        mat2 (list of list of int/float): The second matrix.
+        mat1 (list of list of int/float or Matrix): The first matrix.
+        mat2 (list of list of int/float or Matrix): The second matrix.
 
     Returns:
         list of list of int/float: The result of the matrix
-        multiplication,
+        multiplication (a Matrix if either input is a Matrix),
         or None if the matrices cannot be multiplied.
     """
+    if isinstance(mat1, Matrix) or isinstance(mat2, Matrix):
+        return matrix_mul(as_matrix(mat1), as_matrix(mat2))
+
     if len(mat1[0]) != len(mat2):
         return None
 
-    result = []
-    for i in range(len(mat1)):
-        row = []
-        for j in range(len(mat2[0])):
-            s = 0
-            for k in range(len(mat2)):
-                s += mat1[i][k] * mat2[k][j]
-            row.append(s)
-        result.append(row)
+    cols = list(zip(*mat2))
+    if len(cols) <= TILE:
+        return [[sum(map(mul, row, col)) for col in cols] for row in mat1]
 
+    result = [[] for _ in mat1]
+    for start in range(0, len(cols), TILE):
+        block = cols[start:start + TILE]
+        for row, out in zip(mat1, result):
+            out.extend([sum(map(mul, row, col)) for col in block])
     return result
+
+
+def matrix_mul(mat1, mat2):
+    """
+    Multiplies two flat array('d') backed matrices.
+
+    Args:
+        mat1 (Matrix): The first matrix.
+        mat2 (Matrix): The second matrix.
+
+    Returns:
+        Matrix: The product, or None if the shapes do not match.
+    """
+    if mat1.cols != mat2.rows:
+        return None
+
+    cols = [mat2.column(j) for j in range(mat2.cols)]
+    data = array('d')
+    for i in range(mat1.rows):
+        row = mat1.row(i)
+        data.extend([sum(map(mul, row, col)) for col in cols])
+    return Matrix((mat1.rows, mat2.cols), data)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+This module provides `Matrix`, a compact matrix of floats stored in a
+single flat `array('d')` buffer with a shape and strides, for
+environments where NumPy is not available.
+"""
+from array import array
+import sys
+
+
+class Matrix:
+    """
+    An N-dimensional (usually 1D or 2D) matrix of floats backed by one
+    flat array('d') buffer.
+
+    Entry (i, j, ...) lives at data[offset + i * strides[0] +
+    j * strides[1] + ...], with strides counted in entries. Compared to
+    nested lists of Python floats this stores 8 bytes per entry with no
+    per-row or per-float object overhead, and views such as the
+    transpose share the buffer instead of copying it.
+
+    NumPy can wrap a Matrix without copying through
+    `__array_interface__` (e.g. np.asarray(m)), and contiguous matrices
+    also export the Python buffer protocol on Python 3.12+. The buffer
+    must not be resized while such a wrapper is alive.
+    """
+
+    __slots__ = ('data', 'shape', 'strides', 'offset')
+
+    def __init__(self, shape, data=None, strides=None, offset=0):
+        """
+        Initializes a matrix of the given shape.
+
+        Args:
+            shape (tuple of int): The dimensions, e.g. (rows, cols).
+            data (iterable): Optional row-major entries; zeros if omitted.
+                An array('d') is used as is, without a copy.
+            strides (tuple of int): Optional strides in entries;
+                row-major (C order) if omitted.
+            offset (int): Index in data of the first entry.
+        """
+        shape = tuple(shape)
+        size = 1
+        for dim in shape:
+            size *= dim
+        if data is None:
+            data = array('d', bytes(8 * size))
+        elif not isinstance(data, array) or data.typecode != 'd':
+            data = array('d', data)
+        if strides is None:
+            if len(data) != size:
+                raise ValueError("data must have one entry per element")
+            strides = []
+            step = 1
+            for dim in reversed(shape):
+                strides.append(step)
+                step *= dim
+            strides = tuple(reversed(strides))
+        self.data = data
+        self.shape = shape
+        self.strides = tuple(strides)
+        self.offset = offset
+
+    @classmethod
+    def from_lists(cls, matrix):
+        """
+        Builds a Matrix from nested lists in one pass.
+
+        Args:
+            matrix (list): A rectangular nested list of int/float.
+
+        Returns:
+            Matrix: The flat copy of matrix.
+        """
+        shape, flat = flatten(matrix)
+        data = array('d', flat)
+        return cls(shape, data)
+
+    @property
+    def rows(self):
+        """The number of rows (first dimension)."""
+        return self.shape[0]
+
+    @property
+    def cols(self):
+        """The number of columns (last dimension)."""
+        return self.shape[-1]
+
+    def is_contiguous(self):
+        """
+        Returns True if the entries are stored row-major with no gaps.
+        """
+        step = 1
+        for dim, stride in zip(reversed(self.shape), reversed(self.strides)):
+            if dim != 1 and stride != step:
+                return False
+            step *= dim
+        return True
+
+    def row(self, i):
+        """
+        Returns row i of a 2D matrix as an array('d').
+        """
+        start = self.offset + i * self.strides[0]
+        step = self.strides[1]
+        return self.data[start:start + step * self.cols:step]
+
+    def column(self, j):
+        """
+        Returns column j of a 2D matrix as an array('d').
+        """
+        start = self.offset + j * self.strides[1]
+        step = self.strides[0]
+        return self.data[start:start + step * self.rows:step]
+
+    def flat(self):
+        """
+        Returns the entries in row-major order as an array('d').
+
+        Contiguous matrices are copied with one slice; strided views
+        gather one row at a time.
+        """
+        size = self.size
+        if self.is_contiguous():
+            return self.data[self.offset:self.offset + size]
+        if len(self.shape) == 1:
+            step = self.strides[0]
+            return self.data[self.offset:self.offset + step * size:step]
+        if len(self.shape) == 2:
+            data = array('d')
+            for i in range(self.rows):
+                data.extend(self.row(i))
+            return data
+        return array('d', self.iter_flat())
+
+    def iter_flat(self):
+        """
+        Yields the entries in row-major order for any number of dims.
+        """
+        index = [0] * len(self.shape)
+        for _ in range(self.size):
+            yield self.data[self.offset + sum(
+                i * s for i, s in zip(index, self.strides))]
+            for axis in reversed(range(len(index))):
+                index[axis] += 1
+                if index[axis] < self.shape[axis]:
+                    break
+                index[axis] = 0
+
+    def transpose(self):
+        """
+        Returns the transpose as a view sharing this buffer.
+
+        No entries are copied: the shape and strides are reversed.
+        """
+        return Matrix(self.shape[::-1], self.data, self.strides[::-1],
+                      self.offset)
+
+    def tolist(self):
+        """
+        Returns the matrix as nested lists of floats.
+        """
+        nested = self.flat().tolist()
+        for axis in range(len(self.shape) - 1, 0, -1):
+            dim = self.shape[axis]
+            count = 1
+            for lead in self.shape[:axis]:
+                count *= lead
+            nested = [nested[i * dim:(i + 1) * dim] for i in range(count)]
+        return nested
+
+    @property
+    def __array_interface__(self):
+        """Describes the buffer to NumPy so it can wrap it zero-copy."""
+        address, _ = self.data.buffer_info()
+        return {
+            'version': 3,
+            'shape': self.shape,
+            'typestr': ('<' if sys.byteorder == 'little' else '>') + 'f8',
+            'data': (address + 8 * self.offset, False),
+            'strides': tuple(8 * s for s in self.strides),
+        }
+
+    def __buffer__(self, flags):
+        """Exports a contiguous matrix through the buffer protocol."""
+        if not self.is_contiguous():
+            raise BufferError("only contiguous matrices export a buffer")
+        view = memoryview(self.data)[self.offset:self.offset + self.size]
+        return view.cast('B').cast('d', self.shape)
+
+    @property
+    def size(self):
+        """The number of entries."""
+        size = 1
+        for dim in self.shape:
+            size *= dim
+        return size
+
+    def __len__(self):
+        """Returns the length of the first dimension, like a list."""
+        return self.shape[0]
+
+    def __eq__(self, other):
+        """Compares shape and entries with another Matrix."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self.flat() == other.flat()
+
+    def __repr__(self):
+        """Returns a printable representation."""
+        return "Matrix({})".format(self.tolist())
+
+
+def as_matrix(obj):
+    """
+    Returns obj as a Matrix, converting nested lists if needed.
+    """
+    return obj if isinstance(obj, Matrix) else Matrix.from_lists(obj)
+
+
+def flatten(nested):
+    """
+    Validates the shape of nested lists and flattens them in one pass.
+
+    The nesting is walked level by level: every list at a level must
+    have the same length, so the whole shape is checked without
+    recursing per element.
+
+    Args:
+        nested (list): A rectangular nested list.
+
+    Returns:
+        tuple: (shape, flat) where shape is a list of dimensions and flat
+        the row-major list of leaves.
+
+    Raises:
+        ValueError: If nested is not rectangular.
+    """
+    shape = []
+    level = [nested]
+    while all(isinstance(item, list) for item in level):
+        dim = len(level[0])
+        if any(len(item) != dim for item in level):
+            raise ValueError("matrix must be rectangular")
+        shape.append(dim)
+        level = [leaf for item in level for leaf in item]
+        if not dim:
+            break
+    if any(isinstance(item, list) for item in level):
+        raise ValueError("matrix must be rectangular")
+    return shape, level
+
+
+def unflatten(flat, shape):
+    """
+    Rebuilds nested lists of the given shape from a row-major list.
+
+    Args:
+        flat (list): The leaves in row-major order.
+        shape (list of int): The dimensions.
+
+    Returns:
+        list: The nested lists.
+    """
+    nested = list(flat)
+    for axis in range(len(shape) - 1, 0, -1):
+        dim = shape[axis]
+        count = 1
+        for lead in shape[:axis]:
+            count *= lead
+        nested = [nested[i * dim:(i + 1) * dim] for i in range(count)]
+    return nested
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import math
+
+import numpy as np  # type: ignore
+Normal = __import__('normal').Normal
+Exponential = __import__('exponential').Exponential
+Poisson = __import__('poisson').Poisson
+Binomial = __import__('binomial').Binomial
+
+
+def params(dist):
+    """The fitted parameters of a distribution."""
+    if isinstance(dist, Normal):
+        return dist.mean, dist.stddev
+    if isinstance(dist, Binomial):
+        return dist.n, dist.p
+    return (dist.lambtha,)
+
+
+def same(a, b):
+    """Compares the parameters of two fits to 1e-12 relative error."""
+    return all(math.isclose(x, y, rel_tol=1e-12)
+               for x, y in zip(params(a), params(b)))
+
+
+np.random.seed(0)
+samples = {
+    Normal: np.random.normal(70, 10, 1000).tolist(),
+    Exponential: np.random.exponential(0.5, 1000).tolist(),
+    Poisson: np.random.poisson(5., 1000).tolist(),
+    Binomial: np.random.binomial(50, 0.6, 1000).tolist(),
+}
+for cls, data in samples.items():
+    full = cls(data)
+
+    # Two shards fitted separately, the second in uneven batches
+    left = cls().partial_fit(data[:300])
+    right = cls()
+    for start, stop in ((300, 301), (301, 650), (650, 1000)):
+        right.partial_fit(data[start:stop])
+    merged = left.merge(right)
+
+    streamed = cls.from_stream(iter(data), chunk_size=64)
+    print(cls.__name__, same(merged, full), same(right, cls(data[300:])),
+          same(streamed, full))
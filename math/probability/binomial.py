@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
 """
-Defines an Binomial distribution class without external modules.
+Defines an Binomial distribution class.
+
+Probabilities are computed in log space with math.lgamma, so large n
+neither overflows nor needs big-integer factorials. Scalars are
+evaluated in pure Python; array arguments are evaluated with NumPy by
+vectorized.py, and sample draws from a NumPy generator.
 """
+import math
+
+import numpy as np
 
+vectorized = __import__('vectorized')
+OnlineFit = __import__('moments').OnlineFit
+Moments = __import__('moments').Moments
 
-class Binomial:
+
+class Binomial(OnlineFit):
     """
     Represents a binomial distribution.
 
@@ -13,6 +25,8 @@ class Binomial:
         p (float): Probability of a "success".
     """
 
+    _cdf_table = None
+
     def __init__(self, data=None, n=1, p=0.5):
         """
         Initialize the Binomial distribution.
@@ -43,69 +57,119 @@ class Binomial:
             if len(data) < 2:
                 raise ValueError("data must contain multiple values")
 
-            # Calculate mean and variance from data
-            mean = sum(data) / len(data)
-            variance = sum((x - mean) ** 2 for x in data) / len(data)
+            self.moments = Moments(data)
+            self._fit(self.moments)
 
-            # For binomial distribution: mean = n*p, variance = n*p*(1-p)
-            # From these: p = 1 - (variance/mean), n = mean/p
+    def _fit(self, moments):
+        """
+        Estimates n and p from the moments of the data.
 
-            # Calculate p first
-            p_estimated = 1 - (variance / mean)
+        Args:
+            moments (Moments): Moments of at least two data points.
+        """
+        mean = moments.mean
+        variance = moments.variance
 
-            # Calculate n
-            n_estimated = mean / p_estimated
+        # For binomial distribution: mean = n*p, variance = n*p*(1-p)
+        # From these: p = 1 - (variance/mean), n = mean/p
 
-            # Round n to nearest integer
-            self.n = round(n_estimated)
+        # Calculate p first
+        p_estimated = 1 - (variance / mean)
 
-            # Recalculate p using the rounded n
-            self.p = mean / self.n
+        # Calculate n
+        n_estimated = mean / p_estimated
 
-    def _factorial(self, num):
-        """Returns the factorial of a number"""
-        result = 1
-        for i in range(2, num + 1):
-            result *= i
-        return result
+        # Round n to nearest integer
+        self.n = round(n_estimated)
 
-    def _comb(self, n, k):
-        """Returns the number of combinations of n items taken k at a time"""
-        return self._factorial(n) // (self._factorial(k) *
-                                      self._factorial(n - k))
+        # Recalculate p using the rounded n
+        self.p = mean / self.n
 
-    def pmf(self, k):
+    def logpmf(self, k):
         """
-        Calculates the value of the PMF for a given number of “successes”.
+        Calculates the log of the PMF for a given number of “successes”.
 
         Args:
-            k (int): Number of “successes”
+            k (int or array-like): Number of “successes”
 
         Returns:
-            float: PMF value for k
+            float or numpy.ndarray: log PMF value for k, -inf outside
+            0..n
         """
+        if vectorized.is_array(k):
+            return vectorized.binomial_logpmf(k, self.n, self.p)
         k = int(k)
         if k < 0 or k > self.n:
-            return 0
+            return -math.inf
+
+        n = self.n
+        log_comb = (math.lgamma(n + 1) - math.lgamma(k + 1) -
+                    math.lgamma(n - k + 1))
+        return log_comb + k * math.log(self.p) + (n - k) * math.log1p(-self.p)
+
+    def pmf(self, k):
+        """
+        Calculates the value of the PMF for a given number of “successes”.
 
-        return self._comb(self.n, k) * (self.p ** k) * ((1 - self.p) **
-                                                        (self.n - k))
+        Args:
+            k (int or array-like): Number of “successes”
+
+        Returns:
+            float or numpy.ndarray: PMF value for k
+        """
+        if vectorized.is_array(k):
+            return np.exp(vectorized.binomial_logpmf(k, self.n, self.p))
+        return math.exp(self.logpmf(k))
 
     def cdf(self, k):
         """
         Calculates the value of the CDF for a given number of “successes”.
 
         Args:
-            k (int): Number of “successes”
+            k (int or array-like): Number of “successes”
 
         Returns:
-            float: CDF value for k
+            float or numpy.ndarray: CDF value for k
         """
+        if vectorized.is_array(k):
+            return self._table().cumulative(vectorized.as_counts(k))
         k = int(k)
         if k < 0:
             return 0
 
-        cdf_value = 0
-        for i in range(0, k + 1):
-            cdf_value += self.pmf(i)
-        return cdf_value
+        return self._table().cumulative_at(k)
+
+    def sample(self, size=None, rng=None, out=None):
+        """
+        Draws random variates with NumPy's binomial sampler (BTPE for
+        n * min(p, 1 - p) >= 30, inversion below).
+
+        Args:
+            size (int or tuple, optional): Output shape; None for a
+            single variate.
+            rng (numpy.random.Generator or int, optional): Generator or
+            seed, so that draws are reproducible.
+            out (numpy.ndarray, optional): Buffer to fill; its shape is
+            used instead of size.
+
+        Returns:
+            int or numpy.ndarray: The variates.
+        """
+        rng = np.random.default_rng(rng)
+        if out is None:
+            return rng.binomial(self.n, self.p, size=size)
+        out[...] = rng.binomial(self.n, self.p, size=out.shape)
+        return out
+
+    def _table(self):
+        """Returns the pmf/cdf table, rebuilt if n or p have changed"""
+        key = (self.n, self.p)
+        if self._cdf_table is None or self._cdf_table.key != key:
+            n = self.n
+            # pmf(i + 1) = pmf(i) * (n - i) / (i + 1) * p / (1 - p)
+            log_odds = math.log(self.p) - math.log1p(-self.p)
+            self._cdf_table = vectorized.DiscreteTable(
+                key, self.logpmf,
+                lambda i: np.log((n - i) / (i + 1)) + log_odds,
+                support=n + 1)
+        return self._cdf_table
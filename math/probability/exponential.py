@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 """
-Defines an Exponential distribution class without external modules.
+Defines an Exponential distribution class.
+
+Scalars are evaluated in pure Python; array arguments to pdf and cdf
+are evaluated with NumPy by vectorized.py, and sample draws from a
+NumPy generator.
 """
+import numpy as np
+
+vectorized = __import__('vectorized')
+OnlineFit = __import__('moments').OnlineFit
+Moments = __import__('moments').Moments
 
 
-class Exponential:
+class Exponential(OnlineFit):
     """
     Represents an exponential distribution.
 
@@ -34,18 +43,31 @@ class Exponential:
                 raise TypeError("data must be a list")
             if len(data) < 2:
                 raise ValueError("data must contain multiple values")
-            self.lambtha = float(len(data) / sum(data))
+            self.moments = Moments(data)
+            self._fit(self.moments)
+
+    def _fit(self, moments):
+        """
+        Estimates lambtha from the moments of the data.
+
+        Args:
+            moments (Moments): Moments of at least two data points.
+        """
+        self.lambtha = float(moments.count / moments.total)
 
     def pdf(self, x):
         """
         Calculates the value of the PDF for a given time period x.
 
         Args:
-            x (float): The time period.
+            x (float or array-like): The time period.
 
         Returns:
-            float: PDF value for x, or 0 if x is out of range.
+            float or numpy.ndarray: PDF value for x, or 0 if x is out of
+            range.
         """
+        if vectorized.is_array(x):
+            return vectorized.exponential_pdf(x, self.lambtha)
         if x < 0:
             return 0
         return self.lambtha * (2.7182818285 ** (-self.lambtha * x))
@@ -55,11 +77,39 @@ class Exponential:
         Calculates the value of the CDF for a given time period x.
 
         Args:
-            x (float): The time period.
+            x (float or array-like): The time period.
 
         Returns:
-            float: CDF value for x, or 0 if x is out of range.
+            float or numpy.ndarray: CDF value for x, or 0 if x is out of
+            range.
         """
+        if vectorized.is_array(x):
+            return vectorized.exponential_cdf(x, self.lambtha)
         if x < 0:
             return 0
         return 1 - (2.7182818285 ** (-self.lambtha * x))
+
+    def sample(self, size=None, rng=None, out=None):
+        """
+        Draws random variates by inverting the CDF of uniform variates,
+        x = -log(1 - u) / lambtha.
+
+        Args:
+            size (int or tuple, optional): Output shape; None for a
+            single variate.
+            rng (numpy.random.Generator or int, optional): Generator or
+            seed, so that draws are reproducible.
+            out (numpy.ndarray, optional): float64 buffer to fill; its
+            shape is used instead of size.
+
+        Returns:
+            float or numpy.ndarray: The variates.
+        """
+        rng = np.random.default_rng(rng)
+        if out is None and size is None:
+            return float(-np.log1p(-rng.random()) / self.lambtha)
+        u = rng.random(size, out=out)
+        np.negative(u, out=u)
+        np.log1p(u, out=u)
+        u /= -self.lambtha
+        return u
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Running moments for fitting the distribution classes on streamed data.
+"""
+from itertools import islice
+
+
+class Moments:
+    """
+    Count, sum and sum of squared deviations of the data seen so far.
+
+    Batches are folded in with the pairwise form of Welford's update
+    (Chan et al.), so the data never has to be held at once and two
+    accumulators built on separate shards can be merged exactly.
+
+    Attributes:
+        count (int): Number of data points.
+        total (float): Sum of the data points.
+        m2 (float): Sum of squared deviations from the mean.
+    """
+
+    def __init__(self, data=()):
+        """
+        Initialize the moments of a batch of data.
+
+        Args:
+            data (iterable, optional): The data points.
+        """
+        data = list(data)
+        self.count = len(data)
+        self.total = sum(data)
+        if self.count:
+            mean = self.total / self.count
+            self.m2 = sum((x - mean) ** 2 for x in data)
+        else:
+            self.m2 = 0
+
+    @property
+    def mean(self):
+        """The mean of the data."""
+        return self.total / self.count
+
+    @property
+    def variance(self):
+        """The population variance of the data."""
+        return self.m2 / self.count
+
+    def merge(self, other):
+        """
+        Combines these moments with those of another set of data.
+
+        Args:
+            other (Moments): The moments to combine with.
+
+        Returns:
+            Moments: The moments of both sets together.
+        """
+        merged = Moments()
+        merged.count = self.count + other.count
+        merged.total = self.total + other.total
+        merged.m2 = self.m2 + other.m2
+        if self.count and other.count:
+            delta = other.mean - self.mean
+            merged.m2 += delta * delta * self.count * other.count / \
+                merged.count
+        return merged
+
+
+class OnlineFit:
+    """
+    Mixin adding streaming estimation to a distribution class.
+
+    The class keeps its Moments in self.moments (None when it was built
+    from parameters) and implements _fit(moments) to set its parameters.
+    """
+
+    moments = None
+
+    def partial_fit(self, batch):
+        """
+        Updates the parameters with another batch of data.
+
+        Parameters are only re-estimated once at least two data points
+        have been seen.
+
+        Args:
+            batch (iterable): The new data points.
+
+        Returns:
+            self
+        """
+        moments = Moments(batch)
+        if self.moments is not None:
+            moments = self.moments.merge(moments)
+        self.moments = moments
+        if moments.count >= 2:
+            self._fit(moments)
+        return self
+
+    @classmethod
+    def from_stream(cls, iterable, chunk_size=1024):
+        """
+        Estimates a distribution from a stream in O(chunk_size) memory.
+
+        Args:
+            iterable (iterable): The data points.
+            chunk_size (int): Number of data points folded in at a time.
+
+        Returns:
+            The fitted distribution.
+
+        Raises:
+            ValueError: If the stream has fewer than two data points.
+        """
+        moments = Moments()
+        iterator = iter(iterable)
+        chunk = list(islice(iterator, chunk_size))
+        while chunk:
+            moments = moments.merge(Moments(chunk))
+            chunk = list(islice(iterator, chunk_size))
+        if moments.count < 2:
+            raise ValueError("data must contain multiple values")
+        dist = cls()
+        dist.moments = moments
+        dist._fit(moments)
+        return dist
+
+    def merge(self, other):
+        """
+        Combines two distributions fitted on separate shards of data.
+
+        Args:
+            other: A fitted distribution of the same class.
+
+        Returns:
+            A new distribution fitted on both shards.
+
+        Raises:
+            TypeError: If other is not of the same class.
+            ValueError: If either distribution was not fitted on data.
+        """
+        if type(other) is not type(self):
+            raise TypeError("can only merge distributions of the same type")
+        if self.moments is None or other.moments is None:
+            raise ValueError("can only merge distributions fitted on data")
+        dist = type(self)()
+        dist.moments = self.moments.merge(other.moments)
+        if dist.moments.count >= 2:
+            dist._fit(dist.moments)
+        return dist
@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
 """
 Module that defines a Normal distribution class.
+
+Scalars are evaluated in pure Python; array arguments to pdf, cdf and
+ppf are evaluated with NumPy by vectorized.py, and sample draws from a
+NumPy generator.
 """
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+vectorized = __import__('vectorized')
+OnlineFit = __import__('moments').OnlineFit
+Moments = __import__('moments').Moments
 
 
-class Normal:
+class Normal(OnlineFit):
     """
     Represents a normal distribution.
 
@@ -37,10 +49,18 @@ class Normal:
                 raise TypeError("data must be a list")
             if len(data) < 2:
                 raise ValueError("data must contain multiple values")
-            n = len(data)
-            self.mean = float(sum(data) / n)
-            variance = sum((x - self.mean) ** 2 for x in data) / n
-            self.stddev = variance ** 0.5
+            self.moments = Moments(data)
+            self._fit(self.moments)
+
+    def _fit(self, moments):
+        """
+        Estimates mean and stddev from the moments of the data.
+
+        Args:
+            moments (Moments): Moments of at least two data points.
+        """
+        self.mean = float(moments.mean)
+        self.stddev = moments.variance ** 0.5
 
     def z_score(self, x):
         """
@@ -66,10 +86,12 @@ class Normal:
         """
         Calculates the value of the PDF for a given x-value.
         Args:
-            x (float): The x-value.
+            x (float or array-like): The x-value.
         Returns:
-            float: The PDF value for x.
+            float or numpy.ndarray: The PDF value for x.
         """
+        if vectorized.is_array(x):
+            return vectorized.normal_pdf(x, self.mean, self.stddev)
         # PDF formula: (1 / (σ * √(2π))) * e^(-0.5 * ((x - μ) / σ)^2)
         pi = 3.1415926536
         e = 2.7182818285
@@ -85,29 +107,62 @@ class Normal:
         for a given x-value in the normal distribution.
 
         Args:
-            x (float): The x-value for which to calculate the CDF.
+            x (float or array-like): The x-value for which to calculate
+            the CDF.
 
         Returns:
-            float: The probability that a random variable drawn from this
-            normal distribution is less than or equal to x.
+            float or numpy.ndarray: The probability that a random variable
+            drawn from this normal distribution is less than or equal to x.
         """
+        if vectorized.is_array(x):
+            return vectorized.normal_cdf(x, self.mean, self.stddev)
         z = (x - self.mean) / self.stddev
-        if z < 0:
-            # Use symmetry property
-            return 1 - self.cdf(self.mean - (x - self.mean))
+        return 0.5 * math.erfc(-z / math.sqrt(2))
 
-        p = 0.2316419
-        b1 = 0.319381530
-        b2 = -0.356563782
-        b3 = 1.781477937
-        b4 = -1.821255978
-        b5 = 1.330274429
+    def ppf(self, q):
+        """
+        Calculates the x-value below which a given fraction of the
+        distribution lies (the inverse of the CDF).
 
-        t = 1 / (1 + p * z)
-        pi = 3.141592653589793
-        e = 2.718281828459045
-        pdf = (1 / (2 * pi) ** 0.5) * (e ** (-z * z / 2))
+        Args:
+            q (float or array-like): The probability, in [0, 1].
 
-        poly = b1 * t + b2 * t**2 + b3 * t**3 + b4 * t**4 + b5 * t**5
+        Returns:
+            float or numpy.ndarray: The x-value for q, -inf/inf for q
+            equal to 0/1.
+
+        Raises:
+            ValueError: If a scalar q is not in [0, 1].
+        """
+        if vectorized.is_array(q):
+            return vectorized.normal_ppf(q, self.mean, self.stddev)
+        if q < 0 or q > 1:
+            raise ValueError("q must be between 0 and 1")
+        if q in (0, 1):
+            return math.inf if q else -math.inf
+        return NormalDist(self.mean, self.stddev).inv_cdf(q)
+
+    def sample(self, size=None, rng=None, out=None):
+        """
+        Draws random variates by scaling NumPy's standard normal
+        ziggurat sampler.
 
-        return 1 - pdf * poly
+        Args:
+            size (int or tuple, optional): Output shape; None for a
+            single variate.
+            rng (numpy.random.Generator or int, optional): Generator or
+            seed, so that draws are reproducible.
+            out (numpy.ndarray, optional): float64 buffer to fill; its
+            shape is used instead of size.
+
+        Returns:
+            float or numpy.ndarray: The variates.
+        """
+        rng = np.random.default_rng(rng)
+        if out is None:
+            out = rng.standard_normal(size)
+        else:
+            rng.standard_normal(out=out)
+        out *= self.stddev
+        out += self.mean
+        return out
@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """
-Defines a Poisson distribution class with no external modules.
+Defines a Poisson distribution class.
+
+Probabilities are computed in log space with math.lgamma, so large k
+needs no big-integer factorial. Scalars are evaluated in pure Python;
+array arguments are evaluated with NumPy by vectorized.py, and sample
+draws from a NumPy generator.
 """
+import math
+
+import numpy as np
 
+vectorized = __import__('vectorized')
+OnlineFit = __import__('moments').OnlineFit
+Moments = __import__('moments').Moments
 
-class Poisson:
+
+class Poisson(OnlineFit):
     """
     Represents a Poisson distribution.
     """
 
+    _cdf_table = None
+
     def __init__(self, data=None, lambtha=1.):
         """
         Initializes a Poisson distribution.
@@ -30,52 +44,101 @@ class Poisson:
                 raise TypeError("data must be a list")
             if len(data) < 2:
                 raise ValueError("data must contain multiple values")
-            self.lambtha = float(sum(data) / len(data))
+            self.moments = Moments(data)
+            self._fit(self.moments)
 
-    def pmf(self, k):
+    def _fit(self, moments):
         """
-        Calculates the value of the PMF for a given number of “successes”.
+        Estimates lambtha from the moments of the data.
 
         Args:
-            k (int): The number of occurrences.
+            moments (Moments): Moments of at least two data points.
+        """
+        self.lambtha = float(moments.mean)
+
+    def logpmf(self, k):
+        """
+        Calculates the log of the PMF for a given number of “successes”.
+
+        Args:
+            k (int or array-like): The number of occurrences.
 
         Returns:
-            float: PMF value for k.
+            float or numpy.ndarray: log PMF value for k, -inf for k < 0.
         """
+        if vectorized.is_array(k):
+            return vectorized.poisson_logpmf(k, self.lambtha)
         if not isinstance(k, int):
             k = int(k)
 
         if k < 0:
-            return 0
+            return -math.inf
 
-        # Calculate k!
-        factorial = 1
-        for i in range(1, k + 1):
-            factorial *= i
+        return k * math.log(self.lambtha) - self.lambtha - math.lgamma(k + 1)
 
-        e = 2.7182818285
-        lambtha = self.lambtha
+    def pmf(self, k):
+        """
+        Calculates the value of the PMF for a given number of “successes”.
+
+        Args:
+            k (int or array-like): The number of occurrences.
 
-        return ((lambtha ** k) * (e ** -lambtha)) / factorial
+        Returns:
+            float or numpy.ndarray: PMF value for k.
+        """
+        if vectorized.is_array(k):
+            return np.exp(vectorized.poisson_logpmf(k, self.lambtha))
+        return math.exp(self.logpmf(k))
 
     def cdf(self, k):
         """
         Calculates the CDF value for a given number of successes.
 
         Args:
-            k (int): Number of successes.
+            k (int or array-like): Number of successes.
 
         Returns:
-            float: CDF value for k.
+            float or numpy.ndarray: CDF value for k.
         """
+        if vectorized.is_array(k):
+            return self._table().cumulative(vectorized.as_counts(k))
         if not isinstance(k, int):
             k = int(k)
 
         if k < 0:
             return 0
 
-        cdf_value = 0
-        for i in range(k + 1):
-            cdf_value += self.pmf(i)
+        return self._table().cumulative_at(k)
 
-        return cdf_value
+    def sample(self, size=None, rng=None, out=None):
+        """
+        Draws random variates with NumPy's Poisson sampler (PTRS
+        transformed rejection for lambtha >= 10, multiplication below).
+
+        Args:
+            size (int or tuple, optional): Output shape; None for a
+            single variate.
+            rng (numpy.random.Generator or int, optional): Generator or
+            seed, so that draws are reproducible.
+            out (numpy.ndarray, optional): Buffer to fill; its shape is
+            used instead of size.
+
+        Returns:
+            int or numpy.ndarray: The variates.
+        """
+        rng = np.random.default_rng(rng)
+        if out is None:
+            return rng.poisson(self.lambtha, size=size)
+        out[...] = rng.poisson(self.lambtha, size=out.shape)
+        return out
+
+    def _table(self):
+        """Returns the pmf/cdf table, rebuilt if lambtha has changed"""
+        key = (self.lambtha,)
+        if self._cdf_table is None or self._cdf_table.key != key:
+            # pmf(i + 1) = pmf(i) * lambtha / (i + 1)
+            log_lambtha = math.log(self.lambtha)
+            self._cdf_table = vectorized.DiscreteTable(
+                key, self.logpmf, lambda i: log_lambtha - np.log(i + 1),
+                support=vectorized.poisson_support(self.lambtha))
+        return self._cdf_table
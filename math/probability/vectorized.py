@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Array kernels shared by the distribution classes.
+
+The classes evaluate scalars in pure Python; when they are given a
+list, tuple or numpy array these helpers evaluate every point in one
+NumPy call instead.
+"""
+import math
+
+import numpy as np
+
+# log(k!) for small k; larger k use the Stirling series in log_factorial
+SMALL = 256
+LOG_FACTORIALS = np.array([math.lgamma(k + 1) for k in range(SMALL)])
+
+# Largest number of entries a DiscreteTable stores, and how many it adds
+# per exact anchor
+TABLE_LIMIT = 1 << 20
+TABLE_CHUNK = 1 << 12
+
+# Hart's normal tail numerator and denominator, highest degree first
+CF_TERMS = 40
+HART_NUM = [
+    3.52624965998911e-02, 0.700383064443688, 6.37396220353165,
+    33.912866078383, 112.079291497871, 221.213596169931, 220.206867912376]
+HART_DEN = [
+    8.83883476483184e-02, 1.75566716318264, 16.064177579207,
+    86.7807322029461, 296.564248779674, 637.333633378831,
+    793.826512519948, 440.413735824752]
+
+# Acklam's inverse normal coefficients, highest degree first
+ACKLAM_A = [
+    -3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+    1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+ACKLAM_B = [
+    -5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+    6.680131188771972e+01, -1.328068155288572e+01]
+ACKLAM_C = [
+    -7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+    -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+ACKLAM_D = [
+    7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+    3.754408661907416e+00]
+
+
+def is_array(x):
+    """
+    Tells whether x should be evaluated element-wise.
+
+    Args:
+        x: A scalar, list, tuple or numpy array.
+
+    Returns:
+        bool: True unless x is a scalar (or a 0-d array).
+    """
+    return isinstance(x, (list, tuple)) or np.ndim(x) > 0
+
+
+def as_counts(k):
+    """
+    Truncates k toward zero like int() does, element-wise.
+
+    Args:
+        k: An array-like of numbers of occurrences.
+
+    Returns:
+        numpy.ndarray: The integer counts.
+    """
+    return np.trunc(np.asarray(k, dtype=float)).astype(np.int64)
+
+
+def log_factorial(k):
+    """
+    Evaluates log(k!) element-wise for non-negative integer counts.
+
+    Counts below SMALL are read from a table of math.lgamma values and
+    the rest use the Stirling series, which is accurate to rounding
+    there.
+
+    Args:
+        k (numpy.ndarray): Non-negative integer counts.
+
+    Returns:
+        numpy.ndarray: log(k!).
+    """
+    x = np.maximum(k, SMALL - 1) + 1.
+    inv = 1 / x
+    inv2 = inv * inv
+    series = inv * (1 / 12 - inv2 * (1 / 360 - inv2 / 1260))
+    stirling = (x - 0.5) * np.log(x) - x + 0.5 * np.log(2 * np.pi) + series
+    return np.where(k < SMALL, LOG_FACTORIALS[np.minimum(k, SMALL - 1)],
+                    stirling)
+
+
+def binomial_logpmf(k, n, p):
+    """
+    Evaluates the binomial log pmf element-wise in O(1) per point.
+
+    Args:
+        k: An array-like of numbers of "successes".
+        n (int): Number of Bernoulli trials.
+        p (float): Probability of a "success".
+
+    Returns:
+        numpy.ndarray: log pmf values, -inf outside 0..n.
+    """
+    k = as_counts(k)
+    inside = (k >= 0) & (k <= n)
+    j = np.where(inside, k, 0)
+    logs = (log_factorial(np.full(k.shape, n)) - log_factorial(j) -
+            log_factorial(n - j) + j * np.log(p) + (n - j) * np.log1p(-p))
+    return np.where(inside, logs, -np.inf)
+
+
+def poisson_logpmf(k, lambtha):
+    """
+    Evaluates the Poisson log pmf element-wise in O(1) per point.
+
+    Args:
+        k: An array-like of numbers of occurrences.
+        lambtha (float): Expected number of occurrences.
+
+    Returns:
+        numpy.ndarray: log pmf values, -inf for negative k.
+    """
+    k = as_counts(k)
+    inside = k >= 0
+    j = np.where(inside, k, 0)
+    logs = j * np.log(lambtha) - lambtha - log_factorial(j)
+    return np.where(inside, logs, -np.inf)
+
+
+def poisson_support(lambtha):
+    """
+    Finds a count past which the Poisson upper tail is negligible.
+
+    The Chernoff bound P(X >= k) <= exp(k - lambtha) (lambtha / k)^k,
+    valid for k > lambtha, decreases in k; the smallest k where it falls
+    below eps / 4 is found by doubling and bisection.
+
+    Args:
+        lambtha (float): The expected number of occurrences, > 0.
+
+    Returns:
+        int: A count k with P(X >= k) < eps / 4, so that the cdf rounds
+        to 1 from k on.
+    """
+    target = math.log(np.finfo(float).eps / 4)
+
+    def log_tail(k):
+        """Log of the Chernoff bound on P(X >= k)."""
+        return k - lambtha + k * math.log(lambtha / k)
+
+    lo = math.floor(lambtha) + 1
+    hi = lo
+    while log_tail(hi) > target:
+        lo, hi = hi + 1, 2 * hi
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if log_tail(mid) > target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return hi
+
+
+class DiscreteTable:
+    """
+    Lazily built prefix sums of the pmf of a discrete distribution.
+
+    The table starts at cdf(0) and grows on demand, at least doubling
+    each time, by the running recurrence pmf(i + 1) = pmf(i) * ratio(i)
+    carried out as a cumulative sum of logs, re-anchored on the exact
+    log pmf every TABLE_CHUNK entries so rounding does not build up
+    over long tables. It holds at most `limit`
+    entries: past that it becomes a window that slides forward to the
+    counts being queried, so repeated queries anywhere stay O(1) in
+    bounded memory. Queries spanning more than `limit` counts are
+    answered window by window in ascending order. The cdf is 1 from
+    `support` on, so no entry past it is ever stored. The owner rebuilds
+    the table when `key`, its parameters, no longer match.
+
+    Attributes:
+        key (tuple): The parameters the table was built for.
+        offset (int): The count of the first stored entry.
+        cdf (numpy.ndarray): cdf(offset..offset + m).
+    """
+
+    def __init__(self, key, log_pmf, log_ratio, support=None,
+                 limit=TABLE_LIMIT):
+        """
+        Initializes the table with cdf(0) = pmf(0).
+
+        Args:
+            key (tuple): The parameters the table is built for.
+            log_pmf (callable): Maps a count k to log pmf(k).
+            log_ratio (callable): Maps an array of i to
+            log(pmf(i + 1) / pmf(i)).
+            support (int, optional): Count from which the cdf is 1
+            (to double precision), None if unbounded.
+            limit (int): Largest number of entries to store.
+        """
+        self.key = key
+        self.log_pmf = log_pmf
+        self.log_ratio = log_ratio
+        self.support = support
+        self.limit = limit
+        self.reset()
+
+    def reset(self):
+        """Drops every entry but cdf(0)."""
+        self.offset = 0
+        self.cdf = np.exp([self.log_pmf(0)])
+
+    def grow(self, lo, hi):
+        """
+        Makes the stored entries cover the counts lo..hi.
+
+        Args:
+            lo (int): The smallest count needed, 0 <= lo.
+            hi (int): The largest count needed, within the support and
+            less than lo + limit.
+        """
+        if lo < self.offset:
+            self.reset()
+        end = self.offset + len(self.cdf)
+        if hi < end:
+            return
+        stop = min(max(hi + 1, 2 * end), lo + self.limit)
+        if self.support is not None:
+            stop = min(stop, self.support)
+        while end < stop:
+            step = min(stop - end, self.limit)
+            parts = [self.cdf]
+            for start in range(end, end + step, TABLE_CHUNK):
+                count = min(TABLE_CHUNK, end + step - start)
+                i = np.arange(start - 1, start + count - 1, dtype=float)
+                logs = self.log_pmf(start - 1) + np.cumsum(self.log_ratio(i))
+                parts.append(parts[-1][-1] + np.cumsum(np.exp(logs)))
+            self.cdf = np.concatenate(parts)[-self.limit:]
+            end += step
+            self.offset = end - len(self.cdf)
+
+    def cumulative(self, k):
+        """
+        Reads cdf values at integer counts, growing the table if needed.
+
+        Args:
+            k (numpy.ndarray): Integer counts.
+
+        Returns:
+            numpy.ndarray: The cdf values, shaped like k.
+        """
+        out = np.zeros(k.shape)
+        inside = k >= 0
+        if self.support is not None:
+            out[k >= self.support] = 1.
+            inside &= k < self.support
+        if not inside.any():
+            return out
+        lo, hi = int(k[inside].min()), int(k[inside].max())
+        if hi - lo < self.limit:
+            self.grow(lo, hi)
+            out[inside] = self.cdf[k[inside] - self.offset]
+            return out
+
+        # Too wide for one window: slide it over the sorted counts
+        where = np.flatnonzero(inside.ravel())
+        counts = k.ravel()[where]
+        order = np.argsort(counts, kind='stable')
+        where, counts = where[order], counts[order]
+        flat = out.reshape(-1)
+        start = 0
+        while start < len(counts):
+            first = int(counts[start])
+            stop = int(np.searchsorted(counts, first + self.limit))
+            self.grow(first, int(counts[stop - 1]))
+            flat[where[start:stop]] = self.cdf[counts[start:stop] -
+                                               self.offset]
+            start = stop
+        return out
+
+    def cumulative_at(self, k):
+        """
+        Reads the cdf at one non-negative count, O(1) once it is stored.
+
+        Args:
+            k (int): The count.
+
+        Returns:
+            float: The cdf value.
+        """
+        if self.support is not None and k >= self.support:
+            return 1.
+        self.grow(k, k)
+        return float(self.cdf[k - self.offset])
+
+
+def normal_pdf(x, mean, stddev):
+    """
+    Evaluates the normal pdf element-wise.
+
+    Args:
+        x: An array-like of x-values.
+        mean (float): Mean of the distribution.
+        stddev (float): Standard deviation of the distribution.
+
+    Returns:
+        numpy.ndarray: The pdf values.
+    """
+    z = (np.asarray(x, dtype=float) - mean) / stddev
+    return np.exp(-0.5 * z * z) / (stddev * np.sqrt(2 * np.pi))
+
+
+def normal_tail(a):
+    """
+    Evaluates the standard normal upper tail Q(a) = erfc(a / sqrt(2)) / 2
+    for a >= 0, to about 1e-14 relative accuracy.
+
+    Below 3 it uses Hart's rational approximation of erfc, from 3 on the
+    Laplace continued fraction truncated after CF_TERMS terms. The tail
+    is computed directly, so it keeps its relative accuracy far out
+    where 1 - cdf would cancel to 0.
+
+    Args:
+        a (numpy.ndarray): Non-negative standard scores.
+
+    Returns:
+        numpy.ndarray: The upper tail probabilities.
+    """
+    a = np.minimum(a, 40.)
+    # exp(-a^2 / 2) with a split so that the square of hi is exact
+    hi = np.round(a * 16) / 16
+    exponential = np.exp(-0.5 * hi * hi) * np.exp(-0.5 * (a - hi) * (a + hi))
+    tail = np.empty(a.shape)
+    near = a < 3
+    x = a[near]
+    tail[near] = exponential[near] * np.polyval(HART_NUM, x) / np.polyval(
+        HART_DEN, x)
+    far = ~near
+    x = a[far]
+    frac = x.copy()
+    for term in range(CF_TERMS, 0, -1):
+        frac = x + term / frac
+    tail[far] = exponential[far] / (frac * np.sqrt(2 * np.pi))
+    return tail
+
+
+def normal_cdf(x, mean, stddev):
+    """
+    Evaluates the normal cdf element-wise from the upper tail.
+
+    Args:
+        x: An array-like of x-values.
+        mean (float): Mean of the distribution.
+        stddev (float): Standard deviation of the distribution.
+
+    Returns:
+        numpy.ndarray: The cdf values.
+    """
+    z = (np.asarray(x, dtype=float) - mean) / stddev
+    tail = normal_tail(np.abs(z))
+    return np.where(z < 0, tail, 1 - tail)
+
+
+def normal_ppf(q, mean, stddev):
+    """
+    Evaluates the normal quantile function element-wise.
+
+    Acklam's rational approximation (relative error 1.15e-9) is refined
+    with one Halley step against normal_tail. Both run on the smaller of
+    q and 1 - q, so upper quantiles keep the accuracy of lower ones.
+
+    Args:
+        q: An array-like of probabilities.
+        mean (float): Mean of the distribution.
+        stddev (float): Standard deviation of the distribution.
+
+    Returns:
+        numpy.ndarray: The x-values, -inf/inf at 0/1 and nan outside
+        [0, 1].
+    """
+    q = np.asarray(q, dtype=float)
+    low = np.minimum(q, 1 - q)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.sqrt(-2 * np.log(low))
+        tail = np.polyval(ACKLAM_C, r) / np.polyval(ACKLAM_D + [1.], r)
+        c = low - 0.5
+        c2 = c * c
+        central = c * np.polyval(ACKLAM_A, c2) / np.polyval(
+            ACKLAM_B + [1.], c2)
+        z = np.where(low < 0.02425, tail, central)
+        # Halley step on Q(-z) = low, z <= 0
+        err = normal_tail(-z) - low
+        u = err * np.sqrt(2 * np.pi) * np.exp(0.5 * z * z)
+        z = z - u / (1 + 0.5 * z * u)
+    z = np.where(low == 0, -np.inf, z)
+    z = np.where(q > 0.5, -z, z)
+    z = np.where((q >= 0) & (q <= 1), z, np.nan)
+    return mean + stddev * z
+
+
+def exponential_pdf(x, lambtha):
+    """
+    Evaluates the exponential pdf element-wise.
+
+    Args:
+        x: An array-like of time periods.
+        lambtha (float): The number of occurrences in a given time.
+
+    Returns:
+        numpy.ndarray: The pdf values, 0 for negative x.
+    """
+    x = np.asarray(x, dtype=float)
+    return np.where(x < 0, 0., lambtha * np.exp(-lambtha * np.maximum(x, 0)))
+
+
+def exponential_cdf(x, lambtha):
+    """
+    Evaluates the exponential cdf element-wise.
+
+    Args:
+        x: An array-like of time periods.
+        lambtha (float): The number of occurrences in a given time.
+
+    Returns:
+        numpy.ndarray: The cdf values, 0 for negative x.
+    """
+    x = np.asarray(x, dtype=float)
+    return np.where(x < 0, 0., -np.expm1(-lambtha * np.maximum(x, 0)))